@@ -3,6 +3,7 @@
 from phish_email_detection_agent.domain.url.extract import (
     canonicalize_url,
     extract_urls,
+    extract_urls_bytes,
     is_suspicious_url,
     url_domain,
 )
@@ -11,6 +12,7 @@ from phish_email_detection_agent.domain.url.models import UrlIndicator
 __all__ = [
     "UrlIndicator",
     "extract_urls",
+    "extract_urls_bytes",
     "canonicalize_url",
     "url_domain",
     "is_suspicious_url",
@@ -5,14 +5,48 @@ from __future__ import annotations
 from urllib.parse import urlparse, urlunparse
 import re
 
+# A single negated character class scans in linear time with no backtracking,
+# so multi-megabyte attachment bodies stay regex-engine bound, not NFA bound.
 URL_PATTERN = re.compile(r"https?://[^\s<>()\[\]{}\"']+", re.IGNORECASE)
+# Bytes twin for callers holding raw buffers (PDF bodies, office XML parts);
+# scanning bytes skips decoding megabytes just to regex them.
+URL_PATTERN_BYTES = re.compile(rb"https?://[^\s<>()\[\]{}\"']+", re.IGNORECASE)
 
 
-def extract_urls(text: str) -> list[str]:
-    """Extract HTTP(S) URLs from text."""
+def extract_urls(text: str, *, limit: int | None = None) -> list[str]:
+    """Extract HTTP(S) URLs from text, stopping after ``limit`` distinct hits.
 
-    urls = URL_PATTERN.findall(text or "")
-    return list(dict.fromkeys(canonicalize_url(item) for item in urls if item.strip()))
+    Callers whose scoring saturates after a handful of URLs pass a limit so
+    the scan stops early instead of walking the rest of a large blob.
+    """
+
+    # finditer keeps one match alive at a time instead of materializing every
+    # raw hit before canonicalization; large PDF/HTML blobs can carry thousands.
+    seen: dict[str, None] = {}
+    for match in URL_PATTERN.finditer(text or ""):
+        raw = match.group()
+        if raw.strip():
+            seen.setdefault(canonicalize_url(raw), None)
+            if limit is not None and len(seen) >= limit:
+                break
+    return list(seen)
+
+
+def extract_urls_bytes(data: bytes, *, limit: int | None = None) -> list[str]:
+    """Extract HTTP(S) URLs from raw bytes without decoding the buffer.
+
+    URLs are ASCII by construction, so only the matches themselves are
+    decoded; the surrounding megabytes never become str objects.
+    """
+
+    seen: dict[str, None] = {}
+    for match in URL_PATTERN_BYTES.finditer(data or b""):
+        raw = match.group().decode("ascii", errors="ignore")
+        if raw.strip():
+            seen.setdefault(canonicalize_url(raw), None)
+            if limit is not None and len(seen) >= limit:
+                break
+    return list(seen)
 
 
 def canonicalize_url(url: str) -> str:
@@ -58,6 +58,23 @@ def _redact_text(value: str) -> str:
     return text
 
 
+# Top-level judge-context keys that only carry routes and numeric budgets;
+# they cannot contain PII, so the redactor can pass them through untouched.
+_SAFE_CONTEXT_KEYS = frozenset({"path", "route", "context_budget"})
+
+
+def redact_context(
+    context: dict[str, Any],
+    *,
+    safe_keys: frozenset[str] = _SAFE_CONTEXT_KEYS,
+) -> dict[str, Any]:
+    """Redact a context dict while skipping known PII-free subtrees."""
+    return {
+        str(key): value if key in safe_keys else redact_value(value)
+        for key, value in context.items()
+    }
+
+
 def redact_value(value: Any) -> Any:
     if isinstance(value, dict):
         return {str(key): redact_value(val) for key, val in value.items()}
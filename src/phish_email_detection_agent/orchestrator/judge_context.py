@@ -407,8 +407,13 @@ def resolve_evidence_id(*, judge_context: dict[str, Any], evidence_path: str) ->
     return ""
 
 
-def build_judge_context(*, evidence_pack: EvidencePack, precheck: dict[str, Any]) -> dict[str, Any]:
-    pack = evidence_pack.model_dump(mode="json")
+def build_judge_context(
+    *,
+    evidence_pack: EvidencePack,
+    precheck: dict[str, Any],
+    pack_dump: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    pack = pack_dump if pack_dump is not None else evidence_pack.model_dump(mode="json")
     route = str(pack.get("pre_score", {}).get("route", "")).strip().lower()
     path = map_route_to_path(route)
     budget = _PATH_BUDGETS.get(path, _PATH_BUDGETS["STANDARD"])
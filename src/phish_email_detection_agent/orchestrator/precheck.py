@@ -16,7 +16,7 @@ from phish_email_detection_agent.tools.text.encoding import analyze_url_obfuscat
 from phish_email_detection_agent.tools.text.text_model import contains_phishing_keywords
 from phish_email_detection_agent.tools.url_fetch.service import (
     SafeFetchPolicy,
-    analyze_url_target,
+    analyze_url_targets,
     safe_fetch_url,
 )
 
@@ -487,9 +487,13 @@ def build_web_signals(
     if len(url_signals) > cap:
         provenance["limits_hit"].append("web_snapshot_url_cap")
 
-    for signal in selected:
-        target_url = signal.get("expanded_url") or signal.get("normalized") or signal.get("url")
-        report = analyze_url_target(str(target_url), policy=fetch_policy)
+    target_urls = [
+        str(signal.get("expanded_url") or signal.get("normalized") or signal.get("url"))
+        for signal in selected
+    ]
+    for signal, target_url, report in zip(
+        selected, target_urls, analyze_url_targets(target_urls, policy=fetch_policy)
+    ):
         reports.append(report)
 
         fetch = report.get("fetch", {}) if isinstance(report.get("fetch"), dict) else {}
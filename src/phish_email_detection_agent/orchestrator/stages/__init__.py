@@ -4,6 +4,7 @@ from phish_email_detection_agent.orchestrator.stages.evidence_builder import Evi
 from phish_email_detection_agent.orchestrator.stages.evidence_stage import EvidenceStage
 from phish_email_detection_agent.orchestrator.stages.executor import PipelineExecutor
 from phish_email_detection_agent.orchestrator.stages.judge import JudgeEngine
+from phish_email_detection_agent.orchestrator.stages.judge_batch import BatchingJudgeExecutor
 from phish_email_detection_agent.orchestrator.stages.runtime import PipelineRuntime
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "EvidenceStage",
     "PipelineExecutor",
     "JudgeEngine",
+    "BatchingJudgeExecutor",
     "PipelineRuntime",
 ]
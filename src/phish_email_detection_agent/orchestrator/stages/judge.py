@@ -4,19 +4,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import json
+import os
 from typing import Any
 
+try:  # Optional accelerated JSON encoder.
+    import orjson
+except ImportError:  # pragma: no cover - fallback when perf extra is absent
+    orjson = None  # type: ignore[assignment]
+
 from phish_email_detection_agent.orchestrator.contracts import JudgeOutput, TriageResult
 from phish_email_detection_agent.orchestrator.judge_context import build_judge_context, resolve_evidence_id
 from phish_email_detection_agent.orchestrator.prompts import JUDGE_PROMPT
-from phish_email_detection_agent.evidence.redact import redact_value
+from phish_email_detection_agent.evidence.redact import redact_context
 from phish_email_detection_agent.orchestrator.validator import OnlineValidator, ValidationIssue
 from phish_email_detection_agent.orchestrator.stages.runtime import PipelineRuntime
 from phish_email_detection_agent.orchestrator.verdict_routing import (
     compute_confidence,
     map_route_to_path,
-    merge_judge_verdict,
-    normalize_score_for_verdict,
+    resolve_verdict_and_score,
 )
 from phish_email_detection_agent.tools.text.text_model import derive_email_labels
 
@@ -25,7 +30,51 @@ class JudgeValidationError(RuntimeError):
     """Raised when merged judge output violates online guardrails."""
 
 
-@dataclass
+# Opt-in strict re-validation of the final payload through TriageResult.
+_DEBUG_VALIDATE = os.getenv("MY_AGENT_APP_DEBUG_VALIDATE", "").strip().lower() in {"1", "true", "yes"}
+
+
+def _dump_payload(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=True)
+
+
+def _ordered_dedup(*iterables: Any) -> list[Any]:
+    """Merge iterables into one ordered, duplicate-free list."""
+    seen: dict[Any, None] = {}
+    for iterable in iterables:
+        for item in iterable:
+            seen.setdefault(item, None)
+    return list(seen)
+
+
+_JUDGE_OUTPUT_SCHEMA: Any | None = None
+
+
+def _judge_output_schema() -> Any:
+    """Build the judge output schema once; schema derivation is expensive."""
+    global _JUDGE_OUTPUT_SCHEMA
+    if _JUDGE_OUTPUT_SCHEMA is None:
+        from agents import AgentOutputSchema
+
+        _JUDGE_OUTPUT_SCHEMA = AgentOutputSchema(JudgeOutput, strict_json_schema=False)
+    return _JUDGE_OUTPUT_SCHEMA
+
+
+def _agent_cache_key(common: dict[str, Any]) -> tuple | None:
+    """Derive a hashable cache key from the scalar parts of common kwargs."""
+    key = tuple(
+        sorted(
+            (name, value)
+            for name, value in common.items()
+            if isinstance(value, (str, int, float, bool)) or value is None
+        )
+    )
+    return key or None
+
+
+@dataclass(slots=True)
 class JudgeRunResult:
     final_result: dict[str, Any] | None
     judge_output: JudgeOutput | None
@@ -33,9 +82,10 @@ class JudgeRunResult:
     validation_issues: list[ValidationIssue] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class JudgeEngine:
     validator: OnlineValidator = field(default_factory=OnlineValidator)
+    _agent_cache: dict[tuple, Any] = field(default_factory=dict, init=False, repr=False)
 
     def validate_final_result(self, final_result: dict[str, Any]) -> list[ValidationIssue]:
         return self.validator.validate_triage_result(final_result)
@@ -50,20 +100,30 @@ class JudgeEngine:
         fallback: Any,
     ) -> JudgeRunResult:
         try:
-            from agents import Agent, AgentOutputSchema, Runner
+            from agents import Agent, Runner
 
             common = service.build_common_kwargs()
-            judge_agent = Agent(
-                name="argis-evidence-judge-agent",
-                instructions=JUDGE_PROMPT,
-                output_type=AgentOutputSchema(JudgeOutput, strict_json_schema=False),
-                **common,
+            cache_key = _agent_cache_key(common)
+            judge_agent = self._agent_cache.get(cache_key) if cache_key is not None else None
+            if judge_agent is None:
+                judge_agent = Agent(
+                    name="argis-evidence-judge-agent",
+                    instructions=JUDGE_PROMPT,
+                    output_type=_judge_output_schema(),
+                    **common,
+                )
+                if cache_key is not None:
+                    self._agent_cache[cache_key] = judge_agent
+            pack_dict = evidence_pack.model_dump(mode="json")
+            judge_context = build_judge_context(
+                evidence_pack=evidence_pack,
+                precheck=precheck,
+                pack_dump=pack_dict,
             )
-            judge_context = build_judge_context(evidence_pack=evidence_pack, precheck=precheck)
-            redacted_pack = redact_value(judge_context)
+            redacted_pack = redact_context(judge_context)
             judge_run = Runner.run_sync(
                 judge_agent,
-                json.dumps({"judge_context": redacted_pack}, ensure_ascii=True),
+                _dump_payload({"judge_context": redacted_pack}),
                 max_turns=service.max_turns,
             )
             raw_output = getattr(judge_run, "final_output", {})
@@ -84,25 +144,24 @@ class JudgeEngine:
                         normalized_top_evidence.append(entry)
                     raw_output = dict(raw_output)
                     raw_output["top_evidence"] = normalized_top_evidence
-            judge_output = JudgeOutput.model_validate(raw_output)
+            if isinstance(raw_output, JudgeOutput):
+                # The SDK already parsed into the output schema; skip re-validation.
+                judge_output = raw_output
+            else:
+                judge_output = JudgeOutput.model_validate(raw_output)
 
             deterministic_score = int(evidence_pack.pre_score.risk_score)
             judge_score = max(0, min(100, int(judge_output.risk_score)))
             merged_score = max(deterministic_score, judge_score)
-            merged_verdict = merge_judge_verdict(
+            merged_verdict, merged_score = resolve_verdict_and_score(
                 deterministic_score=deterministic_score,
                 judge_verdict=judge_output.verdict,
                 judge_confidence=float(judge_output.confidence),
+                merged_score=merged_score,
                 suspicious_min_score=service.pipeline_policy.suspicious_min_score,
                 suspicious_max_score=service.pipeline_policy.suspicious_max_score,
                 policy=service.pipeline_policy,
             )
-            merged_score = normalize_score_for_verdict(
-                merged_score,
-                merged_verdict,
-                suspicious_min_score=service.pipeline_policy.suspicious_min_score,
-                suspicious_max_score=service.pipeline_policy.suspicious_max_score,
-            )
             # Final product decision is binary: collapse the ambiguous bucket.
             if merged_verdict == "suspicious":
                 phishing_min_score = max(1, int(service.pipeline_policy.suspicious_max_score) + 1)
@@ -114,52 +173,55 @@ class JudgeEngine:
                 judge_confidence=float(judge_output.confidence),
                 missing_count=len(judge_output.missing_info),
             )
+            combined_urls = list(precheck.get("combined_urls", ()))
             labels = derive_email_labels(
                 verdict=merged_verdict,
                 risk_score=merged_score,
                 subject=getattr(email, "subject", ""),
                 text=getattr(email, "text", ""),
-                urls=list(precheck.get("combined_urls", [])),
+                urls=combined_urls,
             )
 
-            merged_actions = list(
-                dict.fromkeys(
-                    list(getattr(fallback, "recommended_actions", []))
-                    + list(judge_output.recommended_actions)
-                )
+            merged_actions = _ordered_dedup(
+                getattr(fallback, "recommended_actions", ()),
+                judge_output.recommended_actions,
             )
-            merged_indicators = list(
-                dict.fromkeys(
-                    list(precheck.get("indicators", []))
-                    + [item.claim for item in judge_output.top_evidence]
-                )
+            merged_indicators = _ordered_dedup(
+                precheck.get("indicators", ()),
+                (item.claim for item in judge_output.top_evidence),
             )
 
-            final = TriageResult(
-                verdict=merged_verdict,
-                reason=judge_output.reason.strip() or str(getattr(fallback, "reason", "")),
-                path=map_route_to_path(evidence_pack.pre_score.route),
-                risk_score=merged_score,
-                confidence=merged_confidence,
-                email_label=str(labels.get("email_label", "benign")),
-                is_spam=bool(labels.get("is_spam", False)),
-                is_phish_email=bool(labels.get("is_phish_email", False)),
-                spam_score=int(labels.get("spam_score", 0)),
-                threat_tags=list(labels.get("threat_tags", [])),
-                indicators=merged_indicators,
-                recommended_actions=merged_actions,
-                input=email.text,
-                urls=list(precheck.get("combined_urls", [])),
-                attachments=email.attachments,
-                provider_used=service.provider,
-                evidence={
-                    "evidence_pack": evidence_pack.model_dump(mode="json"),
+            judge_dump = judge_output.model_dump(mode="json")
+            # All values are already JSON-native; building TriageResult just to
+            # dump it back out would add a full validation pass per email. The
+            # model check stays available behind a debug flag.
+            final = {
+                "verdict": merged_verdict,
+                "reason": judge_output.reason.strip() or str(getattr(fallback, "reason", "")),
+                "path": map_route_to_path(evidence_pack.pre_score.route),
+                "risk_score": int(merged_score),
+                "confidence": float(merged_confidence),
+                "email_label": str(labels.get("email_label", "benign")),
+                "is_spam": bool(labels.get("is_spam", False)),
+                "is_phish_email": bool(labels.get("is_phish_email", False)),
+                "spam_score": int(labels.get("spam_score", 0)),
+                "threat_tags": list(labels.get("threat_tags", [])),
+                "indicators": merged_indicators,
+                "recommended_actions": merged_actions,
+                "input": email.text,
+                "urls": combined_urls,
+                "attachments": list(email.attachments),
+                "provider_used": service.provider,
+                "evidence": {
+                    "evidence_pack": pack_dict,
                     "evidence_refs": judge_context.get("evidence_refs", []),
                     "judge_context": judge_context,
-                    "judge": judge_output.model_dump(mode="json"),
+                    "judge": judge_dump,
                     "precheck": precheck,
                 },
-            ).model_dump(mode="json")
+            }
+            if _DEBUG_VALIDATE:
+                final = TriageResult.model_validate(final).model_dump(mode="json")
             final["precheck"] = precheck
             validation_issues = self.validate_final_result(final)
             final["validation_issues"] = [
@@ -0,0 +1,102 @@
+"""Group-commit style batching for concurrent judge evaluations."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import queue
+import threading
+import time
+from typing import Any
+
+from phish_email_detection_agent.orchestrator.stages.judge import JudgeEngine, JudgeRunResult
+
+_DEFAULT_MAX_BATCH = 8
+_DEFAULT_MAX_WAIT_S = 0.010
+
+
+@dataclass(slots=True)
+class _PendingJudgeCall:
+    kwargs: dict[str, Any]
+    future: Future
+
+
+class BatchingJudgeExecutor:
+    """Accumulates judge requests and dispatches them as overlapping batches.
+
+    Concurrent pipeline invocations submit into a shared queue; a background
+    dispatcher drains it once ``max_batch`` requests are pending or
+    ``max_wait_s`` elapses, then runs the whole batch through one thread pool
+    so the LLM round-trips are in flight together. A lone caller pays at most
+    ``max_wait_s`` of extra latency.
+    """
+
+    def __init__(
+        self,
+        engine: JudgeEngine | None = None,
+        *,
+        max_batch: int = _DEFAULT_MAX_BATCH,
+        max_wait_s: float = _DEFAULT_MAX_WAIT_S,
+    ) -> None:
+        self._engine = engine if engine is not None else JudgeEngine()
+        self._max_batch = max(1, int(max_batch))
+        self._max_wait_s = max(0.0, float(max_wait_s))
+        self._queue: queue.Queue[_PendingJudgeCall | None] = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=self._max_batch)
+        self._closed = False
+        self._dispatcher = threading.Thread(
+            target=self._drain_loop,
+            name="argis-judge-batch-dispatcher",
+            daemon=True,
+        )
+        self._dispatcher.start()
+
+    def evaluate(self, **kwargs: Any) -> JudgeRunResult:
+        """Blocking submit-and-wait with the same signature as JudgeEngine.evaluate."""
+        return self.submit(**kwargs).result()
+
+    def submit(self, **kwargs: Any) -> Future:
+        if self._closed:
+            raise RuntimeError("BatchingJudgeExecutor is closed.")
+        pending = _PendingJudgeCall(kwargs=kwargs, future=Future())
+        self._queue.put(pending)
+        return pending.future
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+
+    def _drain_loop(self) -> None:
+        while True:
+            head = self._queue.get()
+            if head is None:
+                return
+            batch = [head]
+            deadline = time.monotonic() + self._max_wait_s
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._dispatch(batch)
+                    return
+                batch.append(item)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[_PendingJudgeCall]) -> None:
+        for pending in batch:
+            self._pool.submit(self._run_one, pending)
+
+    def _run_one(self, pending: _PendingJudgeCall) -> None:
+        try:
+            pending.future.set_result(self._engine.evaluate(**pending.kwargs))
+        except Exception as exc:  # pragma: no cover - engine wraps its own errors
+            pending.future.set_exception(exc)
@@ -10,7 +10,7 @@ from typing import Any, Callable
 ToolFn = Callable[..., Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolExecutionResult:
     ok: bool
     tool_name: str
@@ -20,7 +20,7 @@ class ToolExecutionResult:
     elapsed_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutor:
     """Wraps tool execution into a normalized result contract."""
 
@@ -29,7 +29,7 @@ class ToolExecutor:
     def execute(self, *, tool_name: str, tool_fn: ToolFn, **kwargs: Any) -> ToolExecutionResult:
         attempts = 0
         max_attempts = max(1, int(self.max_retries) + 1)
-        start = time.perf_counter()
+        start_ns = time.monotonic_ns()
         last_error: Exception | None = None
 
         for _ in range(max_attempts):
@@ -41,7 +41,7 @@ class ToolExecutor:
                     tool_name=str(tool_name),
                     output=output,
                     attempts=attempts,
-                    elapsed_ms=int((time.perf_counter() - start) * 1000),
+                    elapsed_ms=(time.monotonic_ns() - start_ns) // 1_000_000,
                 )
             except Exception as exc:  # pragma: no cover - caller-driven failures
                 last_error = exc
@@ -52,5 +52,5 @@ class ToolExecutor:
             tool_name=str(tool_name),
             error=error_name,
             attempts=attempts,
-            elapsed_ms=int((time.perf_counter() - start) * 1000),
+            elapsed_ms=(time.monotonic_ns() - start_ns) // 1_000_000,
         )
@@ -8,26 +8,58 @@ from typing import Any
 
 _ALLOWED_VERDICTS = {"benign", "phishing", "suspicious"}
 
+# Shared empty result for the clean fast path; treat as immutable.
+_NO_ISSUES: list["ValidationIssue"] = []
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     code: str
     message: str
     severity: str = "warning"
 
 
+_ISSUE_MISSING_INDICATORS = ValidationIssue(
+    code="missing_indicators",
+    message="Phishing verdict should include at least one indicator.",
+)
+_ISSUE_MISSING_EVIDENCE = ValidationIssue(
+    code="missing_evidence",
+    message="Phishing verdict should include evidence payload.",
+)
+_INVALID_VERDICT_TMPL = "Unexpected verdict value: {!r}."
+_INVALID_SCORE_TYPE_TMPL = "Risk score must be int-like, got {}."
+_INVALID_SCORE_RANGE_TMPL = "Risk score out of range [0, 100]: {}."
+
+
 class OnlineValidator:
     """Lightweight guardrails that do not depend on model/tool internals."""
 
     def validate_triage_result(self, result: dict[str, Any]) -> list[ValidationIssue]:
-        issues: list[ValidationIssue] = []
         verdict = str(result.get("verdict", "")).strip().lower()
+        raw = result.get("risk_score", 0)
+        if (
+            verdict in _ALLOWED_VERDICTS
+            and isinstance(raw, int)
+            and 0 <= raw <= 100
+            and (
+                verdict != "phishing"
+                or (
+                    isinstance(result.get("indicators"), list)
+                    and result.get("indicators")
+                    and isinstance(result.get("evidence"), dict)
+                )
+            )
+        ):
+            return _NO_ISSUES
+
+        issues: list[ValidationIssue] = []
         if verdict not in _ALLOWED_VERDICTS:
             issues.append(
                 ValidationIssue(
                     code="invalid_verdict",
                     severity="error",
-                    message=f"Unexpected verdict value: {verdict!r}.",
+                    message=_INVALID_VERDICT_TMPL.format(verdict),
                 )
             )
 
@@ -39,7 +71,7 @@ class OnlineValidator:
                 ValidationIssue(
                     code="invalid_risk_score_type",
                     severity="error",
-                    message=f"Risk score must be int-like, got {type(raw_score).__name__}.",
+                    message=_INVALID_SCORE_TYPE_TMPL.format(type(raw_score).__name__),
                 )
             )
             score = -1
@@ -48,25 +80,15 @@ class OnlineValidator:
                 ValidationIssue(
                     code="invalid_risk_score_range",
                     severity="error",
-                    message=f"Risk score out of range [0, 100]: {score}.",
+                    message=_INVALID_SCORE_RANGE_TMPL.format(score),
                 )
             )
 
         indicators = result.get("indicators")
         if verdict == "phishing" and (not isinstance(indicators, list) or not indicators):
-            issues.append(
-                ValidationIssue(
-                    code="missing_indicators",
-                    message="Phishing verdict should include at least one indicator.",
-                )
-            )
+            issues.append(_ISSUE_MISSING_INDICATORS)
 
         evidence = result.get("evidence")
         if verdict == "phishing" and not isinstance(evidence, dict):
-            issues.append(
-                ValidationIssue(
-                    code="missing_evidence",
-                    message="Phishing verdict should include evidence payload.",
-                )
-            )
+            issues.append(_ISSUE_MISSING_EVIDENCE)
         return issues
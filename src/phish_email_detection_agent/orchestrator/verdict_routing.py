@@ -4,17 +4,27 @@ from __future__ import annotations
 
 from phish_email_detection_agent.orchestrator.pipeline_policy import PipelinePolicy
 
+_ROUTE_MAP = {
+    "allow": "FAST",
+    "review": "STANDARD",
+    "deep": "DEEP",
+}
+_VERDICTS = frozenset({"benign", "suspicious", "phishing"})
+# PipelinePolicy is frozen, so the normalized default never changes.
+_DEFAULT_ACTIVE_POLICY = PipelinePolicy().normalized()
+
+
+def _norm(value: str | None) -> str:
+    """Normalize a route/verdict token; inputs usually arrive pre-normalized."""
+    return value.strip().lower() if isinstance(value, str) else ""
+
 
 def _phishing_min_score(suspicious_max_score: int) -> int:
     return max(1, int(suspicious_max_score) + 1)
 
 
 def map_route_to_path(route: str) -> str:
-    return {
-        "allow": "FAST",
-        "review": "STANDARD",
-        "deep": "DEEP",
-    }.get(str(route or "").strip().lower(), "STANDARD")
+    return _ROUTE_MAP.get(_norm(route), "STANDARD")
 
 
 def verdict_from_score(score: int, *, suspicious_min_score: int, suspicious_max_score: int) -> str:
@@ -32,7 +42,7 @@ def normalize_score_for_verdict(
     suspicious_min_score: int,
     suspicious_max_score: int,
 ) -> int:
-    clean_verdict = str(verdict or "").strip().lower()
+    clean_verdict = _norm(verdict)
     phishing_min = _phishing_min_score(suspicious_max_score)
     if clean_verdict == "phishing":
         return max(phishing_min, score)
@@ -50,7 +60,7 @@ def merge_judge_verdict(
     suspicious_max_score: int,
     policy: PipelinePolicy | None = None,
 ) -> str:
-    active = (policy or PipelinePolicy()).normalized()
+    active = policy.normalized() if policy is not None else _DEFAULT_ACTIVE_POLICY
     phishing_min = _phishing_min_score(suspicious_max_score)
     low_band_promote_hi = max(
         active.judge_promote_low_to_suspicious_confidence,
@@ -65,8 +75,8 @@ def merge_judge_verdict(
         suspicious_min_score=suspicious_min_score,
         suspicious_max_score=suspicious_max_score,
     )
-    clean_judge = str(judge_verdict or "").strip().lower()
-    if clean_judge not in {"benign", "suspicious", "phishing"}:
+    clean_judge = _norm(judge_verdict)
+    if clean_judge not in _VERDICTS:
         clean_judge = base
 
     if deterministic_score >= phishing_min:
@@ -97,13 +107,41 @@ def merge_judge_verdict(
     return clean_judge
 
 
+def resolve_verdict_and_score(
+    *,
+    deterministic_score: int,
+    judge_verdict: str,
+    judge_confidence: float,
+    merged_score: int,
+    suspicious_min_score: int,
+    suspicious_max_score: int,
+    policy: PipelinePolicy | None = None,
+) -> tuple[str, int]:
+    """Merge the judge verdict and clamp the score to its band in one step."""
+    verdict = merge_judge_verdict(
+        deterministic_score=deterministic_score,
+        judge_verdict=judge_verdict,
+        judge_confidence=judge_confidence,
+        suspicious_min_score=suspicious_min_score,
+        suspicious_max_score=suspicious_max_score,
+        policy=policy,
+    )
+    score = normalize_score_for_verdict(
+        merged_score,
+        verdict,
+        suspicious_min_score=suspicious_min_score,
+        suspicious_max_score=suspicious_max_score,
+    )
+    return verdict, score
+
+
 def compute_confidence(*, score: int, verdict: str, judge_confidence: float, missing_count: int) -> float:
     confidence = float(judge_confidence)
     if confidence <= 0:
         confidence = max(0.0, min(1.0, round(0.35 + (score / 100.0) * 0.55, 2)))
     if missing_count > 0:
         confidence -= min(0.2, missing_count * 0.05)
-    clean_verdict = str(verdict or "").strip().lower()
+    clean_verdict = _norm(verdict)
     if clean_verdict == "suspicious":
         confidence = min(confidence, 0.78)
     if clean_verdict == "benign" and score >= 20:
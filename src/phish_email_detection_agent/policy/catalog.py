@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
+import stat as stat_module
 from dataclasses import dataclass
 from pathlib import Path
-import re
 
 _SKILL_MD = "SKILL.md"
-_FRONT_MATTER_RE = re.compile(r"^\s*---\n(.*?)\n---\n?", re.DOTALL)
 _ENV_SKILLPACKS_DIR = "MY_AGENT_APP_SKILLPACKS_DIR"
 
+# Discovery cache keyed by root path. The signature combines the directory
+# mtime with the newest SKILL.md mtime and the candidate count, so both
+# added/removed packs and edited manifests invalidate it; warm calls cost a
+# stat per pack instead of a read.
+_DISCOVERY_CACHE: dict[str, tuple[tuple[int, int, int], list["InstalledSkillPack"]]] = {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class InstalledSkillPack:
     name: str
     description: str
@@ -29,11 +35,22 @@ def default_skillpacks_dir() -> Path:
 
 
 def _parse_front_matter(text: str) -> dict[str, str]:
-    match = _FRONT_MATTER_RE.match(text)
-    if match is None:
+    # String-level scan: only the front-matter slice is walked, not the body.
+    start = 0
+    length = len(text)
+    while start < length and text[start] in " \t\r\n":
+        start += 1
+    if text.startswith("---\n", start):
+        start += 4
+    elif text.startswith("---\r\n", start):
+        start += 5
+    else:
+        return {}
+    end = text.find("\n---", start)
+    if end < 0:
         return {}
     values: dict[str, str] = {}
-    for line in match.group(1).splitlines():
+    for line in text[start:end].splitlines():
         row = line.strip()
         if not row or row.startswith("#") or ":" not in row:
             continue
@@ -49,19 +66,54 @@ def discover_installed_skillpacks(
     if not root.exists() or not root.is_dir():
         return []
 
-    skillpacks: list[InstalledSkillPack] = []
-    for entry in sorted(root.iterdir()):
-        if not entry.is_dir():
-            continue
-        skill_md = entry / _SKILL_MD
-        if not skill_md.is_file():
-            continue
+    try:
+        root_stat = os.stat(root)
+    except OSError:
+        return []
 
+    candidates: list[tuple[Path, Path]] = []
+    newest_manifest_ns = 0
+    # os.scandir reuses the dirent type from the directory read, avoiding a
+    # stat() per entry that Path.is_dir() would issue. Symlinks must still be
+    # followed so a linked skillpack directory stays discoverable; only those
+    # entries pay the extra stat.
+    with os.scandir(root) as entries:
+        for entry in sorted(entries, key=lambda item: item.name):
+            if not entry.is_dir():
+                continue
+            skill_md_path = os.path.join(entry.path, _SKILL_MD)
+            try:
+                manifest_stat = os.stat(skill_md_path)
+            except OSError:
+                continue
+            if not stat_module.S_ISREG(manifest_stat.st_mode):
+                continue
+            newest_manifest_ns = max(newest_manifest_ns, manifest_stat.st_mtime_ns)
+            candidates.append((Path(entry.path), Path(skill_md_path)))
+    if not candidates:
+        return []
+
+    root_key = str(root)
+    signature = (root_stat.st_mtime_ns, newest_manifest_ns, len(candidates))
+    cached = _DISCOVERY_CACHE.get(root_key)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
+
+    def _read(skill_md: Path) -> str | None:
         try:
-            front_matter = _parse_front_matter(skill_md.read_text(encoding="utf-8"))
+            return skill_md.read_text(encoding="utf-8")
         except OSError:
-            continue
+            return None
 
+    # Reads are I/O-latency bound on cold cache; overlap them across packs.
+    with ThreadPoolExecutor(max_workers=min(16, len(candidates))) as pool:
+        bodies = list(pool.map(_read, (skill_md for _, skill_md in candidates)))
+
+    skillpacks: list[InstalledSkillPack] = []
+    for (entry, skill_md), body in zip(candidates, bodies):
+        if body is None:
+            continue
+        front_matter = _parse_front_matter(body)
         name = str(front_matter.get("name") or entry.name).strip() or entry.name
         description = str(front_matter.get("description") or "").strip()
         skillpacks.append(
@@ -72,4 +124,5 @@ def discover_installed_skillpacks(
                 skill_md=str(skill_md),
             )
         )
-    return skillpacks
+    _DISCOVERY_CACHE[root_key] = (signature, skillpacks)
+    return list(skillpacks)
@@ -68,11 +68,14 @@ FIXED_SKILL_DEFINITIONS: tuple[FixedSkillDefinition, ...] = (
 )
 
 FIXED_SKILL_CHAIN: tuple[str, ...] = tuple(item.name for item in FIXED_SKILL_DEFINITIONS)
-_FIXED_SKILL_BY_NAME = {item.name: item for item in FIXED_SKILL_DEFINITIONS}
+# Definitions are frozen, so each spec is deterministic; build them once.
+_FIXED_SPEC_BY_NAME: dict[str, SkillSpec] = {
+    item.name: item.to_spec() for item in FIXED_SKILL_DEFINITIONS
+}
 
 
 def fixed_skill_spec(name: str) -> SkillSpec:
-    skill = _FIXED_SKILL_BY_NAME.get(str(name).strip())
-    if skill is None:
+    spec = _FIXED_SPEC_BY_NAME.get(str(name).strip())
+    if spec is None:
         raise KeyError(f"Unknown fixed skill: {name!r}")
-    return skill.to_spec()
+    return spec
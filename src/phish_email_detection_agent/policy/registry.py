@@ -9,7 +9,7 @@ from typing import Any, Callable
 SkillRunner = Callable[..., Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillSpec:
     name: str
     description: str
@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass
+import functools
 import hashlib
+import mmap
 import os
 from pathlib import Path
 import re
+import stat as stat_module
 import subprocess
 import tempfile
+import threading
 from typing import Any
 import zipfile
 
 from phish_email_detection_agent.domain.attachment.detect import classify_attachment
-from phish_email_detection_agent.domain.url.extract import extract_urls
+from phish_email_detection_agent.domain.url.extract import extract_urls, extract_urls_bytes
 from phish_email_detection_agent.tools.url_fetch.service import analyze_html_content
 
 
 @dataclass
 class AttachmentPolicy:
     max_read_bytes: int = 4_000_000
+    hash_algorithm: str = "sha256"
     enable_ocr: bool = False
     ocr_backend: str = "tesseract"
     ocr_languages: str = "eng"
@@ -33,59 +39,145 @@ class AttachmentPolicy:
     openai_base_url: str | None = None
 
 
-def _sha256_file(path: Path) -> str:
-    hasher = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(65536), b""):
-            hasher.update(block)
-    return hasher.hexdigest()
+def _new_hasher(algorithm: str) -> tuple[Any, str]:
+    """Build a hasher for the policy's algorithm, falling back to SHA-256.
+
+    The digest only serves as a local fingerprint, so the faster blake3 can
+    be opted into when its package is installed; hashing a large attachment
+    is pure compute and blake3 runs SIMD-parallel internally.
+    """
+    if algorithm.strip().lower() == "blake3":
+        try:
+            import blake3  # type: ignore
+        except Exception:
+            return hashlib.sha256(), "sha256"
+        return blake3.blake3(), "blake3"
+    return hashlib.sha256(), "sha256"
+
 
+def _inspect_file(path: Path, max_read_bytes: int, algorithm: str = "sha256") -> tuple[str, str, bytes]:
+    """Hash the whole file and slice the analysis head in one pass.
 
-def _read_head(path: Path, max_bytes: int) -> bytes:
+    Mapping the file lets the hasher consume it as a single buffer in C
+    (with the GIL released) and the head become a plain slice, instead of
+    reading the first max_read_bytes twice as separate head/hash passes.
+    Returns (algorithm_used, hexdigest, head).
+    """
+    hasher, used = _new_hasher(algorithm)
     with path.open("rb") as handle:
-        return handle.read(max_bytes)
+        try:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+                return used, hasher.hexdigest(), bytes(mapped[:max_read_bytes])
+        except (ValueError, OSError):
+            # Empty file or mmap-unsupported filesystem; fall back to a read.
+            data = handle.read()
+            hasher.update(data)
+            return used, hasher.hexdigest(), data[:max_read_bytes]
+
+
+_MAGIC_PREFIXES: tuple[tuple[bytes, str], ...] = (
+    (b"%PDF-", "pdf"),
+    (b"PK\x03\x04", "zip"),
+    (b"PK\x05\x06", "zip"),
+    (b"PK\x07\x08", "zip"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "ole"),
+    (b"\x89PNG\r\n\x1a\n", "image"),
+    (b"\xff\xd8\xff", "image"),
+    (b"GIF87a", "image"),
+    (b"GIF89a", "image"),
+    (b"RIFF", "audio"),
+    (b"ID3", "audio"),
+)
+_HTML_PREFIXES = (b"<!doctype html", b"<html", b"<HTML", b"<?xml")
+_EXT_TYPE = {
+    ".pdf": "pdf",
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".gif": "image",
+    ".bmp": "image",
+    ".webp": "image",
+    ".wav": "audio",
+    ".mp3": "audio",
+    ".m4a": "audio",
+    ".ogg": "audio",
+    ".flac": "audio",
+    ".docx": "zip",
+    ".xlsx": "zip",
+    ".pptx": "zip",
+    ".zip": "zip",
+    ".doc": "ole",
+    ".xls": "ole",
+    ".ppt": "ole",
+    ".htm": "html",
+    ".html": "html",
+}
 
 
 def _detect_magic_type(data: bytes, filename: str) -> str:
-    if data.startswith(b"%PDF-"):
-        return "pdf"
-    if data.startswith((b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")):
-        return "zip"
-    if data.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
-        return "ole"
-    if data.startswith(b"\x89PNG\r\n\x1a\n"):
-        return "image"
-    if data.startswith(b"\xff\xd8\xff"):
-        return "image"
-    if data.startswith((b"GIF87a", b"GIF89a")):
-        return "image"
-    if data.startswith((b"RIFF", b"ID3")):
-        return "audio"
-    if data.lstrip().startswith((b"<!doctype html", b"<html", b"<HTML", b"<?xml")):
-        return "html"
-
-    lower = filename.lower()
-    if lower.endswith(".pdf"):
-        return "pdf"
-    if lower.endswith((".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")):
-        return "image"
-    if lower.endswith((".wav", ".mp3", ".m4a", ".ogg", ".flac")):
-        return "audio"
-    if lower.endswith((".docx", ".xlsx", ".pptx", ".zip")):
-        return "zip"
-    if lower.endswith((".doc", ".xls", ".ppt")):
-        return "ole"
-    if lower.endswith((".htm", ".html")):
+    for prefix, file_type in _MAGIC_PREFIXES:
+        if data.startswith(prefix):
+            return file_type
+    # Only probe the first few bytes for HTML; lstrip on the full head would
+    # copy the whole buffer just to skip leading whitespace.
+    if data[:64].lstrip().startswith(_HTML_PREFIXES):
         return "html"
-    return "unknown"
+    return _EXT_TYPE.get(Path(filename).suffix.lower(), "unknown")
+
+
+# All marker/keyword ladders below are compiled into single alternations so
+# each buffer is scanned once instead of once per token.
+_PDF_MARKER_RE = re.compile(rb"/javascript|/js|/acform|/annots", re.IGNORECASE)
+_OCR_TEXT_TOKENS = ("password", "verify", "urgent", "scan qr", "login", "account suspended")
+_OCR_BRAND_TOKENS = ("microsoft", "paypal", "apple", "google", "bank")
+_OCR_HIT_RE = re.compile(
+    "|".join(re.escape(token) for token in _OCR_TEXT_TOKENS + _OCR_BRAND_TOKENS),
+    re.IGNORECASE,
+)
+_TRANSCRIPT_TOKENS = (
+    "wire transfer",
+    "urgent",
+    "immediately",
+    "confidential",
+    "don't call",
+    "payment today",
+)
+_TRANSCRIPT_RE = re.compile("|".join(re.escape(token) for token in _TRANSCRIPT_TOKENS), re.IGNORECASE)
+_SOCIAL_FILENAME_RE = re.compile(r"invoice|payment|login|verify", re.IGNORECASE)
+_IMAGE_NAME_TOKENS = ("invoice", "login", "verify", "qr", "payment", "account", "microsoft", "bank")
+_AUDIO_NAME_TOKENS = ("ceo", "urgent", "wire", "transfer", "payment", "invoice")
+
+
+def _dedup(values: list[str]) -> list[str]:
+    """Order-preserving dedup with a set; cheaper than a dict for URL lists."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            out.append(value)
+    return out
 
 
 def _analyze_pdf(data: bytes) -> dict[str, Any]:
-    lower = data.lower()
-    js_flags = [token.decode("ascii") for token in (b"/javascript", b"/js") if token in lower]
-    form_like = b"/acform" in lower or b"/annots" in lower
-    decoded = data.decode("latin-1", errors="ignore")
-    urls = extract_urls(decoded)
+    # Only marker presence matters; iterate matches and stop as soon as all
+    # four are seen instead of materializing every repeat with findall (a big
+    # PDF can carry thousands of /annots entries).
+    hits: set[bytes] = set()
+    for match in _PDF_MARKER_RE.finditer(data):
+        hits.add(match.group().lower())
+        if len(hits) == 4:
+            break
+    if b"/javascript" in hits:
+        # "/js" is a prefix of "/javascript"; keep the legacy double marker.
+        hits.add(b"/js")
+    js_flags = [token.decode("ascii") for token in (b"/javascript", b"/js") if token in hits]
+    form_like = b"/acform" in hits or b"/annots" in hits
+    # The bytes scan skips materializing a latin-1 str copy of the body. No
+    # extraction cap: the score saturates on its own below, but every
+    # distinct URL must flow downstream into URL analysis.
+    urls = extract_urls_bytes(data)
     score = min(100, len(js_flags) * 30 + (20 if form_like else 0) + min(20, len(urls) * 4))
     return {
         "embedded_javascript": bool(js_flags),
@@ -105,7 +197,7 @@ def _analyze_zip_office(path: Path) -> dict[str, Any]:
             names = zf.namelist()
             for name in names:
                 lower = name.lower()
-                if "vba" in lower or lower.endswith("vbaproject.bin"):
+                if lower.endswith("vbaproject.bin") or "vba" in lower:
                     macro_like = True
                     suspicious_entries.append(name)
                 if lower.endswith((".xml", ".rels")):
@@ -113,7 +205,7 @@ def _analyze_zip_office(path: Path) -> dict[str, Any]:
                         payload = zf.read(name)
                     except Exception:
                         continue
-                    urls.extend(extract_urls(payload.decode("utf-8", errors="ignore")))
+                    urls.extend(extract_urls_bytes(payload))
     except zipfile.BadZipFile:
         return {"macro_like": False, "suspicious_entries": [], "urls": [], "risk_score": 0}
 
@@ -121,7 +213,7 @@ def _analyze_zip_office(path: Path) -> dict[str, Any]:
     return {
         "macro_like": macro_like,
         "suspicious_entries": suspicious_entries,
-        "urls": list(dict.fromkeys(urls)),
+        "urls": _dedup(urls),
         "risk_score": min(100, score),
     }
 
@@ -129,6 +221,8 @@ def _analyze_zip_office(path: Path) -> dict[str, Any]:
 def _analyze_html_attachment(data: bytes) -> dict[str, Any]:
     text = data.decode("utf-8", errors="replace")
     html = analyze_html_content(text)
+    # No extraction cap: the score contribution saturates on its own, but
+    # every distinct URL must flow downstream into URL analysis.
     urls = extract_urls(text)
     score = min(100, int(html.get("impersonation_score", 0) * 0.8) + min(20, len(urls) * 3))
     return {
@@ -175,7 +269,46 @@ def _decode_qr_codes(path: Path) -> tuple[list[str], str | None]:
             continue
         if data:
             urls.append(data)
-    return list(dict.fromkeys(urls)), None
+    return _dedup(urls), None
+
+
+# Client instances keyed by a key digest (never the raw key) and base URL, so
+# batches of audio attachments reuse one HTTPS session instead of
+# renegotiating TLS per file.
+_OPENAI_CLIENT_CACHE: dict[tuple[str, str], Any] = {}
+
+
+def _get_openai_client(api_key: str, base_url: str | None) -> Any:
+    from openai import OpenAI  # type: ignore
+
+    cache_key = (
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16],
+        base_url or "",
+    )
+    client = _OPENAI_CLIENT_CACHE.get(cache_key)
+    if client is None:
+        kwargs: dict[str, Any] = {"api_key": api_key}
+        if base_url:
+            kwargs["base_url"] = base_url
+        client = OpenAI(**kwargs)
+        _OPENAI_CLIENT_CACHE[cache_key] = client
+    return client
+
+
+@functools.lru_cache(maxsize=4)
+def _get_whisper_model(model_size: str, device: str, compute_type: str) -> Any:
+    """Load a WhisperModel once per configuration; loads take seconds."""
+    from faster_whisper import WhisperModel  # type: ignore
+
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_whisper_cpp_model(model_size: str) -> Any:
+    """Load a whisper.cpp model once; in-process, no fork per transcription."""
+    from pywhispercpp.model import Model  # type: ignore
+
+    return Model(model_size)
 
 
 def _transcribe_with_openai(path: Path, policy: AttachmentPolicy) -> tuple[str, str, str | None]:
@@ -183,17 +316,13 @@ def _transcribe_with_openai(path: Path, policy: AttachmentPolicy) -> tuple[str,
     if not api_key:
         return "", "openai", "missing_openai_api_key"
     try:
-        from openai import OpenAI  # type: ignore
+        from openai import OpenAI  # noqa: F401  # type: ignore
     except Exception:
         return "", "openai", "openai_dependency_missing"
 
-    kwargs: dict[str, Any] = {"api_key": api_key}
     base_url = policy.openai_base_url or os.getenv("OPENAI_BASE_URL")
-    if base_url:
-        kwargs["base_url"] = base_url
-
     try:
-        client = OpenAI(**kwargs)
+        client = _get_openai_client(api_key, base_url)
         with path.open("rb") as audio_file:
             response = client.audio.transcriptions.create(model=policy.audio_model, file=audio_file)
         text = getattr(response, "text", None)
@@ -206,18 +335,52 @@ def _transcribe_with_openai(path: Path, policy: AttachmentPolicy) -> tuple[str,
 
 def _transcribe_with_faster_whisper(path: Path, policy: AttachmentPolicy) -> tuple[str, str, str | None]:
     try:
-        from faster_whisper import WhisperModel  # type: ignore
+        from faster_whisper import WhisperModel  # noqa: F401  # type: ignore
     except Exception:
         return "", "faster-whisper", "faster_whisper_dependency_missing"
     try:
-        model = WhisperModel(policy.audio_local_model_size or "small", device="cpu", compute_type="int8")
-        segments, _ = model.transcribe(str(path), vad_filter=True)
-        text = " ".join(seg.text.strip() for seg in segments if getattr(seg, "text", "").strip())
-        return text, "faster-whisper", None
+        model = _get_whisper_model(policy.audio_local_model_size or "small", "cpu", "int8")
+        # Greedy decoding without cross-segment conditioning is markedly
+        # faster and plenty for keyword spotting on call recordings.
+        segments, _ = model.transcribe(
+            str(path),
+            vad_filter=True,
+            beam_size=1,
+            condition_on_previous_text=False,
+        )
+        parts: list[str] = []
+        total = 0
+        for seg in segments:
+            chunk = getattr(seg, "text", "").strip()
+            if not chunk:
+                continue
+            parts.append(chunk)
+            total += len(chunk) + 1
+            # Downstream keeps a 600-char sample; stop decoding long audio
+            # once there is comfortably more transcript than that.
+            if total > 2000:
+                break
+        return " ".join(parts), "faster-whisper", None
     except Exception as exc:
         return "", "faster-whisper", f"faster_whisper_error:{type(exc).__name__}"
 
 
+def _transcribe_with_whisper_cpp(path: Path, policy: AttachmentPolicy) -> tuple[str, str, str | None]:
+    try:
+        from pywhispercpp.model import Model  # noqa: F401  # type: ignore
+    except Exception:
+        return "", "whisper-cpp", "whisper_cpp_dependency_missing"
+    try:
+        model = _get_whisper_cpp_model(policy.audio_local_model_size or "small")
+        segments = model.transcribe(str(path))
+        text = " ".join(
+            getattr(seg, "text", "").strip() for seg in segments if getattr(seg, "text", "").strip()
+        )
+        return text, "whisper-cpp", None
+    except Exception as exc:
+        return "", "whisper-cpp", f"whisper_cpp_error:{type(exc).__name__}"
+
+
 def _transcribe_with_whisper_cli(path: Path, policy: AttachmentPolicy) -> tuple[str, str, str | None]:
     with tempfile.TemporaryDirectory(prefix="argis_whisper_") as tmpdir:
         cmd = [
@@ -253,17 +416,17 @@ def _transcribe_audio(path: Path, policy: AttachmentPolicy) -> tuple[str, str, s
         return _transcribe_with_openai(path, policy)
     if backend in {"faster-whisper", "faster_whisper"}:
         return _transcribe_with_faster_whisper(path, policy)
+    if backend in {"whisper-cpp", "whisper_cpp"}:
+        return _transcribe_with_whisper_cpp(path, policy)
     if backend in {"whisper-cli", "whisper_cli"}:
         return _transcribe_with_whisper_cli(path, policy)
     return "", backend, "unsupported_audio_backend"
 
 
 def _analyze_image(path: Path, policy: AttachmentPolicy) -> dict[str, Any]:
-    hints = [
-        token
-        for token in ("invoice", "login", "verify", "qr", "payment", "account", "microsoft", "bank")
-        if token in path.name.lower()
-    ]
+    # Lowercase once; the comprehension otherwise re-lowers the name per token.
+    name_lc = path.name.lower()
+    hints = [token for token in _IMAGE_NAME_TOKENS if token in name_lc]
 
     ocr_text = ""
     ocr_backend = policy.ocr_backend
@@ -276,12 +439,9 @@ def _analyze_image(path: Path, policy: AttachmentPolicy) -> dict[str, Any]:
     if policy.enable_qr_decode:
         qr_urls, qr_error = _decode_qr_codes(path)
 
-    text_hits = [
-        token
-        for token in ("password", "verify", "urgent", "scan qr", "login", "account suspended")
-        if token in ocr_text.lower()
-    ]
-    brand_hits = [token for token in ("microsoft", "paypal", "apple", "google", "bank") if token in ocr_text.lower()]
+    ocr_found = {match.lower() for match in _OCR_HIT_RE.findall(ocr_text)}
+    text_hits = [token for token in _OCR_TEXT_TOKENS if token in ocr_found]
+    brand_hits = [token for token in _OCR_BRAND_TOKENS if token in ocr_found]
 
     score = 0
     score += len(hints) * 6
@@ -306,29 +466,16 @@ def _analyze_image(path: Path, policy: AttachmentPolicy) -> dict[str, Any]:
 
 
 def _analyze_audio(path: Path, policy: AttachmentPolicy) -> dict[str, Any]:
-    filename_hits = [
-        token
-        for token in ("ceo", "urgent", "wire", "transfer", "payment", "invoice")
-        if token in path.name.lower()
-    ]
+    name_lc = path.name.lower()
+    filename_hits = [token for token in _AUDIO_NAME_TOKENS if token in name_lc]
     transcript = ""
     backend = policy.audio_backend
     transcribe_error = None
     if policy.enable_audio_transcription:
         transcript, backend, transcribe_error = _transcribe_audio(path, policy)
 
-    transcript_hits = [
-        token
-        for token in (
-            "wire transfer",
-            "urgent",
-            "immediately",
-            "confidential",
-            "don't call",
-            "payment today",
-        )
-        if token in transcript.lower()
-    ]
+    transcript_found = {match.lower() for match in _TRANSCRIPT_RE.findall(transcript)}
+    transcript_hits = [token for token in _TRANSCRIPT_TOKENS if token in transcript_found]
     score = min(100, len(filename_hits) * 10 + len(transcript_hits) * 15)
     return {
         "transcription_enabled": policy.enable_audio_transcription,
@@ -341,6 +488,28 @@ def _analyze_audio(path: Path, policy: AttachmentPolicy) -> dict[str, Any]:
     }
 
 
+# Completed reports keyed by (name, mtime_ns, size, policy fields). Forwarded
+# chains routinely reference the same attachment more than once; re-running
+# hashing, OCR, or transcription on an unchanged file is pure waste.
+_REPORT_CACHE: dict[tuple, dict[str, Any]] = {}
+_REPORT_CACHE_LOCK = threading.Lock()
+_REPORT_CACHE_MAX = 128
+
+
+def _copy_report(report: dict[str, Any]) -> dict[str, Any]:
+    copied = dict(report)
+    copied["indicators"] = list(report["indicators"])
+    copied["extracted_urls"] = list(report["extracted_urls"])
+    # details only ever nests flat lists (urls, suspicious_entries,
+    # qr_payloads, ...); copying them keeps the cached report isolated from
+    # callers that mutate their copy.
+    copied["details"] = {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in report["details"].items()
+    }
+    return copied
+
+
 def analyze_single_attachment(
     item: str,
     policy: AttachmentPolicy | None = None,
@@ -351,7 +520,21 @@ def analyze_single_attachment(
         return {"name": "", "type": "unknown", "risk_score": 0, "indicators": ["empty_attachment_name"]}
 
     path = Path(filename)
-    exists = path.exists() and path.is_file()
+    # One stat answers existence, regular-file-ness, and the cache identity;
+    # the exists()/is_file() pair costs two syscalls for the same data.
+    try:
+        file_stat = os.stat(path)
+        exists = stat_module.S_ISREG(file_stat.st_mode)
+    except OSError:
+        file_stat = None
+        exists = False
+    cache_key: tuple | None = None
+    if exists and file_stat is not None:
+        cache_key = (filename, file_stat.st_mtime_ns, file_stat.st_size, astuple(cfg))
+        with _REPORT_CACHE_LOCK:
+            cached = _REPORT_CACHE.get(cache_key)
+        if cached is not None:
+            return _copy_report(cached)
     heuristic_risk = classify_attachment(filename)
     base_indicators = [f"filename_risk:{heuristic_risk}"]
     report: dict[str, Any] = {
@@ -362,6 +545,7 @@ def analyze_single_attachment(
         "indicators": base_indicators[:],
         "extracted_urls": [],
         "sha256": None,
+        "blake3": None,
         "details": {},
     }
 
@@ -374,13 +558,14 @@ def analyze_single_attachment(
         return report
 
     try:
-        data = _read_head(path, cfg.max_read_bytes)
+        head_bytes = min(file_stat.st_size, cfg.max_read_bytes) if file_stat is not None else cfg.max_read_bytes
+        hash_used, digest, data = _inspect_file(path, head_bytes, cfg.hash_algorithm)
     except Exception:
         report["indicators"].append("read_error")
         report["risk_score"] = 30
         return report
 
-    report["sha256"] = _sha256_file(path)
+    report[hash_used] = digest
     file_type = _detect_magic_type(data, filename)
     report["type"] = file_type
 
@@ -408,33 +593,50 @@ def analyze_single_attachment(
         deep_score = int(details.get("risk_score", 0))
     elif file_type == "image":
         details = _analyze_image(path, cfg)
-        extracted_urls = list(dict.fromkeys(details.get("qr_payloads", [])))
+        extracted_urls = _dedup(details.get("qr_payloads", []))
         deep_score = int(details.get("risk_score", 0))
     elif file_type == "audio":
         details = _analyze_audio(path, cfg)
         deep_score = int(details.get("risk_score", 0))
     else:
-        decoded = data.decode("latin-1", errors="ignore")
-        extracted_urls = extract_urls(decoded)
+        extracted_urls = extract_urls_bytes(data)
         if extracted_urls:
             deep_score = min(40, len(extracted_urls) * 8)
             details = {"urls": extracted_urls, "risk_score": deep_score}
 
     report["details"] = details
-    report["extracted_urls"] = list(dict.fromkeys(extracted_urls))
+    report["extracted_urls"] = _dedup(extracted_urls)
     score_from_name = {"low_risk": 8, "macro_risk": 55, "high_risk": 70}.get(heuristic_risk, 10)
     report["risk_score"] = min(100, max(score_from_name, deep_score))
     if report["risk_score"] >= 60:
         report["indicators"].append("attachment_high_risk")
     if report["extracted_urls"]:
         report["indicators"].append("attachment_contains_url")
-    if re.search(r"(invoice|payment|login|verify)", filename, flags=re.IGNORECASE):
+    if _SOCIAL_FILENAME_RE.search(filename):
         report["indicators"].append("social_engineering_filename")
+    if cache_key is not None:
+        # analyze_attachments fans out on a thread pool, so evict-then-insert
+        # must run under the lock or two threads at capacity race the pop.
+        entry = _copy_report(report)
+        with _REPORT_CACHE_LOCK:
+            if len(_REPORT_CACHE) >= _REPORT_CACHE_MAX:
+                _REPORT_CACHE.pop(next(iter(_REPORT_CACHE)))
+            _REPORT_CACHE[cache_key] = entry
     return report
 
 
 def analyze_attachments(items: list[str], policy: AttachmentPolicy | None = None) -> dict[str, Any]:
-    reports = [analyze_single_attachment(item, policy=policy) for item in (items or [])]
+    items = list(items or [])
+    if len(items) <= 1:
+        reports = [analyze_single_attachment(item, policy=policy) for item in items]
+    else:
+        # Each attachment is independent (hashing, zip reads, OCR, network
+        # transcription are all I/O-heavy), so overlap them; map preserves
+        # order. Blocking reads release the GIL, so for forwarded bundles of
+        # many small files a wide pool keeps the request queue at the kernel
+        # full much like batched async submission would.
+        with ThreadPoolExecutor(max_workers=min(32, len(items))) as pool:
+            reports = list(pool.map(lambda item: analyze_single_attachment(item, policy=policy), items))
     risky = [report["name"] for report in reports if int(report.get("risk_score", 0)) >= 60]
     extracted_urls: list[str] = []
     for report in reports:
@@ -444,5 +646,5 @@ def analyze_attachments(items: list[str], policy: AttachmentPolicy | None = None
         "risky": risky,
         "risky_count": len(risky),
         "reports": reports,
-        "extracted_urls": list(dict.fromkeys(extracted_urls)),
+        "extracted_urls": _dedup(extracted_urls),
     }
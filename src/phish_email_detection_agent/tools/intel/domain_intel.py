@@ -26,21 +26,34 @@ class DomainIntelPolicy:
     synthetic_service_bonus: int = 18
 
 
-def _levenshtein(a: str, b: str) -> int:
+def _edit_distance_is_one(a: str, b: str) -> bool:
+    """True when the Levenshtein distance between a and b is exactly 1.
+
+    Typosquat detection only cares about distance == 1, so a banded O(n)
+    scan replaces the full O(n*m) dynamic-programming matrix: at most one
+    substitution (equal lengths) or one insertion (lengths differing by 1).
+    """
     if a == b:
-        return 0
-    if not a:
-        return len(b)
-    if not b:
-        return len(a)
-    prev = list(range(len(b) + 1))
-    for i, ca in enumerate(a, start=1):
-        curr = [i]
-        for j, cb in enumerate(b, start=1):
-            cost = 0 if ca == cb else 1
-            curr.append(min(curr[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost))
-        prev = curr
-    return prev[-1]
+        return False
+    len_a, len_b = len(a), len(b)
+    if len_a == len_b:
+        mismatches = 0
+        for ca, cb in zip(a, b):
+            if ca != cb:
+                mismatches += 1
+                if mismatches > 1:
+                    return False
+        return mismatches == 1
+    if len_a > len_b:
+        a, b = b, a
+        len_a, len_b = len_b, len_a
+    if len_b - len_a != 1:
+        return False
+    # b is a plus one inserted character iff the strings agree around one gap.
+    i = 0
+    while i < len_a and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1 :]
 
 
 def _base_domain(host: str) -> str:
@@ -54,8 +67,7 @@ def _detect_typosquat(host: str) -> list[str]:
     base = _base_domain(host).split(".")[0]
     hits: list[str] = []
     for brand in COMMON_BRANDS:
-        distance = _levenshtein(base, brand)
-        if distance == 1:
+        if _edit_distance_is_one(base, brand):
             hits.append(brand)
             continue
         if base.startswith(brand) and len(base) - len(brand) <= 8:
@@ -6,11 +6,19 @@ import re
 from typing import Any
 
 
-_AUTH_RESULT_PATTERN = re.compile(r"\b(?P<key>spf|dkim|dmarc)\s*=\s*(?P<value>[a-zA-Z_]+)")
+# All auth patterns are case-insensitive so they can run on the raw header
+# string; lowercasing a multi-KB Authentication-Results blob per email just
+# to match against it costs a full copy.
+_AUTH_RESULT_PATTERN = re.compile(r"\b(?P<key>spf|dkim|dmarc)\s*=\s*(?P<value>[a-zA-Z_]+)", re.IGNORECASE)
 _EMAIL_DOMAIN_PATTERN = re.compile(r"@([a-z0-9.-]+\.[a-z]{2,})", re.IGNORECASE)
 _PRIVATE_IP_PATTERN = re.compile(
     r"\b(?:127\.|10\.|192\.168\.|169\.254\.|172\.(?:1[6-9]|2\d|3[0-1])\.)"
 )
+_SPF_MAILFROM_PATTERN = re.compile(
+    r"\bsmtp\.mailfrom=([a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})", re.IGNORECASE
+)
+_DKIM_DOMAIN_PATTERN = re.compile(r"\bd=([a-z0-9.-]+\.[a-z]{2,})", re.IGNORECASE)
+_DMARC_POLICY_PATTERN = re.compile(r"\bp=([a-z]+)\b", re.IGNORECASE)
 
 
 def _extract_domain(raw: str) -> str:
@@ -32,26 +40,41 @@ def _parse_auth_results(headers: dict[str, str]) -> dict[str, dict[str, str]]:
         str(headers.get(key, ""))
         for key in ("authentication-results", "received-spf", "arc-authentication-results")
     )
-    lowered = source.lower()
-    for match in _AUTH_RESULT_PATTERN.finditer(lowered):
-        key = match.group("key")
-        value = match.group("value")
-        auth[key]["result"] = value
+    # Only the small captured groups are lowercased, never the whole source.
+    for match in _AUTH_RESULT_PATTERN.finditer(source):
+        auth[match.group("key").lower()]["result"] = match.group("value").lower()
 
-    spf_mail_from = re.search(r"\bsmtp\.mailfrom=([a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})", lowered)
+    spf_mail_from = _SPF_MAILFROM_PATTERN.search(source)
     if spf_mail_from:
         auth["spf"]["domain"] = _extract_domain(spf_mail_from.group(1))
-    dkim_domain = re.search(r"\bd=([a-z0-9.-]+\.[a-z]{2,})", lowered)
+    dkim_domain = _DKIM_DOMAIN_PATTERN.search(source)
     if dkim_domain:
-        auth["dkim"]["domain"] = dkim_domain.group(1)
-    dmarc_policy = re.search(r"\bp=([a-z]+)\b", lowered)
+        auth["dkim"]["domain"] = dkim_domain.group(1).lower()
+    dmarc_policy = _DMARC_POLICY_PATTERN.search(source)
     if dmarc_policy:
-        auth["dmarc"]["policy"] = dmarc_policy.group(1)
+        auth["dmarc"]["policy"] = dmarc_policy.group(1).lower()
     return auth
 
 
-def _received_lines(headers_raw: str) -> list[str]:
-    return [line.strip() for line in (headers_raw or "").splitlines() if line.lower().startswith("received:")]
+def _walk_received(headers_raw: str) -> tuple[int, bool, bool]:
+    """Single pass over the raw headers for the Received-chain signals.
+
+    Returns (hop count, has private IP hop, has localhost hop); folding the
+    checks into the collection loop avoids re-scanning the chain per signal.
+    """
+    count = 0
+    has_private_ip = False
+    has_localhost = False
+    for line in (headers_raw or "").splitlines():
+        lowered = line.lower()
+        if not lowered.startswith("received:"):
+            continue
+        count += 1
+        if not has_private_ip and _PRIVATE_IP_PATTERN.search(line):
+            has_private_ip = True
+        if not has_localhost and "localhost" in lowered:
+            has_localhost = True
+    return count, has_private_ip, has_localhost
 
 
 def analyze_headers(
@@ -63,16 +86,16 @@ def analyze_headers(
 ) -> dict[str, Any]:
     header_map = {str(k).lower(): str(v) for k, v in (headers or {}).items()}
     auth = _parse_auth_results(header_map)
-    received_lines = _received_lines(headers_raw)
+    received_hops, has_private_ip, has_localhost = _walk_received(headers_raw)
     suspicious_received: list[str] = []
     has_header_context = bool((headers_raw or "").strip()) or bool(header_map)
-    if has_header_context and not received_lines:
+    if has_header_context and not received_hops:
         suspicious_received.append("missing_received_headers")
-    if len(received_lines) >= 9:
+    if received_hops >= 9:
         suspicious_received.append("unusually_long_received_chain")
-    if any(_PRIVATE_IP_PATTERN.search(line) for line in received_lines):
+    if has_private_ip:
         suspicious_received.append("private_ip_in_received_chain")
-    if any("localhost" in line.lower() for line in received_lines):
+    if has_localhost:
         suspicious_received.append("localhost_received_hop")
 
     sender_domain = _extract_domain(sender)
@@ -91,7 +114,7 @@ def analyze_headers(
         "dkim": auth["dkim"],
         "dmarc": auth["dmarc"],
         "from_replyto_mismatch": mismatch,
-        "received_hops": len(received_lines),
+        "received_hops": received_hops,
         "suspicious_received_patterns": suspicious_received,
         "confidence": confidence,
     }
@@ -14,7 +14,7 @@ from phish_email_detection_agent.orchestrator.policy import route_text
 from phish_email_detection_agent.tools.attachment.analyze import AttachmentPolicy, analyze_attachments
 from phish_email_detection_agent.tools.intel.domain_intel import analyze_domain
 from phish_email_detection_agent.tools.text.text_model import (
-    contains_phishing_keywords,
+    keyword_scan_core,
     normalize_text as normalize_text_value,
 )
 from phish_email_detection_agent.tools.url_fetch.service import SafeFetchPolicy, analyze_url_target
@@ -23,12 +23,6 @@ from phish_email_detection_agent.tools.url_fetch.service import SafeFetchPolicy,
 ToolCallable = Callable[..., object]
 
 
-def _keyword_matches(text: str) -> list[str]:
-    raw = (text or "").lower()
-    keywords = ("verify", "password", "urgent", "invoice", "wire transfer")
-    return [item for item in keywords if item in raw]
-
-
 def normalize_text(text: str) -> str:
     """Normalize spaces/newlines in email text before analysis."""
 
@@ -38,9 +32,9 @@ def normalize_text(text: str) -> str:
 def keyword_scan(text: str) -> dict[str, object]:
     """Scan text for common phishing keywords and return matches."""
 
-    matches = _keyword_matches(text)
+    is_suspicious, matches = keyword_scan_core(text)
     return {
-        "is_suspicious": contains_phishing_keywords(text),
+        "is_suspicious": is_suspicious,
         "matches": matches,
         "count": len(matches),
     }
@@ -106,18 +100,21 @@ def attachments_deep(attachments: list[str]) -> dict[str, object]:
     return analyze_attachments(attachments, policy=AttachmentPolicy(enable_ocr=False))
 
 
+_TOOL_FUNCTIONS: tuple[ToolCallable, ...] = (
+    normalize_text,
+    keyword_scan,
+    route_path,
+    extract_urls,
+    check_url,
+    attachment_risk,
+    parse_email,
+    url_target,
+    domain_intel,
+    attachments_deep,
+)
+
+
 def openai_tool_functions() -> list[ToolCallable]:
     """Return canonical function-tool callables in stable registration order."""
 
-    return [
-        normalize_text,
-        keyword_scan,
-        route_path,
-        extract_urls,
-        check_url,
-        attachment_risk,
-        parse_email,
-        url_target,
-        domain_intel,
-        attachments_deep,
-    ]
+    return list(_TOOL_FUNCTIONS)
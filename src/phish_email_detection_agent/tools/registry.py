@@ -3,8 +3,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import sys
 from typing import Callable
 
+# Wrapped tools keyed by (function_tool, callable). function_tool introspects
+# the signature and builds a JSON schema on every call, so repeated registry
+# constructions (one per agent spinup) reuse the prebuilt tool objects. The
+# wrapper itself is part of the key so a swapped-in agents module never sees
+# tools built by a different one.
+_WRAPPED_TOOLS: dict[tuple[object, object], object] = {}
+
+
+def _resolve_function_tool() -> object:
+    """Fetch agents.function_tool with one dict lookup per call.
+
+    Going through sys.modules directly skips the from-import machinery while
+    still honouring a swapped-in agents module, which a module-level binding
+    taken at import time would not.
+    """
+    module = sys.modules.get("agents")
+    if module is None:
+        import agents as module  # noqa: PLC0415
+    return module.function_tool
+
+
+def _wrapped_tool(func: Callable[..., object]) -> object:
+    function_tool = _resolve_function_tool()
+    key = (function_tool, func)
+    tool = _WRAPPED_TOOLS.get(key)
+    if tool is None:
+        tool = function_tool(func)
+        _WRAPPED_TOOLS[key] = tool
+    return tool
+
 
 @dataclass
 class ToolRegistry:
@@ -13,9 +44,7 @@ class ToolRegistry:
     _tools: list[object] = field(default_factory=list)
 
     def register_callable(self, func: Callable[..., object]) -> None:
-        from agents import function_tool
-
-        self._tools.append(function_tool(func))
+        self._tools.append(_wrapped_tool(func))
 
     def register_default_tools(self) -> None:
         from phish_email_detection_agent.tools.openai.builtin import openai_tool_functions
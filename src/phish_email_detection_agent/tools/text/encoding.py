@@ -12,16 +12,25 @@ import base64
 import binascii
 import html
 import re
+import string
 from typing import Any
-from urllib.parse import parse_qsl, unquote, urlparse
+from urllib.parse import unquote, urlparse
 
 from phish_email_detection_agent.domain.url.extract import extract_urls
 
 _PERCENT_ENCODED_RE = re.compile(r"%[0-9A-Fa-f]{2}")
 _HTML_ENTITY_RE = re.compile(r"&(?:#\d{1,7}|#x[0-9A-Fa-f]{1,6}|[A-Za-z]{2,32});")
-_BASE64_ALLOWED_RE = re.compile(r"^[A-Za-z0-9+/]+={0,2}$")
-_BASE64URL_ALLOWED_RE = re.compile(r"^[A-Za-z0-9_-]+={0,2}$")
-_DATA_URI_RE = re.compile(r"^data:(?P<mime>[^;,]*)(?P<params>(?:;[^,]*)*?),(?P<data>.*)$", re.IGNORECASE)
+# Alphabet membership via bytes.translate deletion sets: translating away
+# every allowed byte leaves b"" iff the string is pure alphabet — a plain
+# C scan with no regex state machine.
+_B64_STD_CHARS = (string.ascii_letters + string.digits + "+/").encode("ascii")
+_B64_URL_CHARS = (string.ascii_letters + string.digits + "-_").encode("ascii")
+# One pass for "decoded payload carries a URL or markup" instead of three
+# substring scans plus a full lowercase copy.
+_URL_OR_HTML_RE = re.compile(r"https?://|<html", re.IGNORECASE)
+# Maps printable ASCII (32..126) to \x01 and everything else to \x00 so a
+# printable count becomes translate + count instead of a per-char loop.
+_PRINTABLE_LUT = bytes(1 if 32 <= b < 127 else 0 for b in range(256))
 
 
 @dataclass(frozen=True)
@@ -54,11 +63,17 @@ def _clip_text(value: str, max_chars: int) -> tuple[str, bool]:
 
 
 def _percent_sequence_count(value: str) -> int:
-    return len(_PERCENT_ENCODED_RE.findall(value or ""))
+    # Most query values carry no escapes at all; a substring probe skips the
+    # regex engine entirely on that common case.
+    if not value or "%" not in value:
+        return 0
+    return len(_PERCENT_ENCODED_RE.findall(value))
 
 
 def _html_entity_count(value: str) -> int:
-    return len(_HTML_ENTITY_RE.findall(value or ""))
+    if not value or "&" not in value:
+        return 0
+    return len(_HTML_ENTITY_RE.findall(value))
 
 
 def normalize_text_layers(value: str, *, budget: DecodeBudget | None = None) -> dict[str, Any]:
@@ -87,7 +102,9 @@ def normalize_text_layers(value: str, *, budget: DecodeBudget | None = None) ->
             output_truncated = output_truncated or clipped
 
     for _ in range(max(0, int(cfg.max_decode_rounds))):
-        if _percent_sequence_count(normalized) == 0:
+        # Only presence matters here; search stops at the first escape
+        # instead of counting them all like the reported metric does.
+        if "%" not in normalized or not _PERCENT_ENCODED_RE.search(normalized):
             break
         decoded = unquote(normalized)
         if decoded == normalized:
@@ -108,22 +125,37 @@ def normalize_text_layers(value: str, *, budget: DecodeBudget | None = None) ->
     }
 
 
+# (-len) % 4 is always 0..3; indexing a prebuilt suffix beats building one.
+_B64_PADS = ("", "=", "==", "===")
+
+
 def _pad_base64(value: str) -> str:
-    missing = (-len(value)) % 4
-    if missing:
-        return value + ("=" * missing)
-    return value
+    return value + _B64_PADS[(-len(value)) % 4]
 
 
-def _looks_like_base64(value: str) -> bool:
-    candidate = (value or "").strip()
-    if len(candidate) < 16:
-        return False
-    if len(candidate) > 50_000:
-        return False
+def _classify_base64(candidate: str) -> tuple[bool, bool]:
+    """Return (looks_like_base64, urlsafe) for a candidate string.
+
+    The standard alphabet is tried first, so the urlsafe flag is only set
+    for strings that need the - _ altchars.
+    """
+    if len(candidate) < 16 or len(candidate) > 50_000:
+        return False, False
     if candidate.count("=") > 2:
-        return False
-    return bool(_BASE64_ALLOWED_RE.fullmatch(candidate) or _BASE64URL_ALLOWED_RE.fullmatch(candidate))
+        return False, False
+    body = candidate.rstrip("=")
+    # "=" is only valid as trailing padding.
+    if not body or "=" in body:
+        return False, False
+    try:
+        raw = body.encode("ascii")
+    except UnicodeEncodeError:
+        return False, False
+    if not raw.translate(None, _B64_STD_CHARS):
+        return True, False
+    if not raw.translate(None, _B64_URL_CHARS):
+        return True, True
+    return False, False
 
 
 def try_decode_base64_text(value: str, *, budget: DecodeBudget | None = None) -> dict[str, Any] | None:
@@ -134,7 +166,8 @@ def try_decode_base64_text(value: str, *, budget: DecodeBudget | None = None) ->
 
     cfg = budget or DecodeBudget()
     candidate = (value or "").strip()
-    if not _looks_like_base64(candidate):
+    looks_like, urlsafe = _classify_base64(candidate)
+    if not looks_like:
         return None
     if len(candidate) > cfg.max_base64_input_chars:
         return {
@@ -144,7 +177,6 @@ def try_decode_base64_text(value: str, *, budget: DecodeBudget | None = None) ->
             "input_len": len(candidate),
         }
 
-    urlsafe = bool(_BASE64URL_ALLOWED_RE.fullmatch(candidate) and not _BASE64_ALLOWED_RE.fullmatch(candidate))
     padded = _pad_base64(candidate)
     try:
         raw = padded.encode("ascii")
@@ -175,7 +207,12 @@ def try_decode_base64_text(value: str, *, budget: DecodeBudget | None = None) ->
 
     printable_ratio = 0.0
     if sample:
-        printable_ratio = round(sum(1 for ch in sample if ch.isprintable()) / len(sample), 2)
+        if sample.isascii():
+            # C-level translate + count; matches str.isprintable for ASCII.
+            printable = sample.encode("ascii").translate(_PRINTABLE_LUT).count(1)
+        else:
+            printable = sum(1 for ch in sample if ch.isprintable())
+        printable_ratio = round(printable / len(sample), 2)
 
     return {
         "kind": "base64url" if urlsafe else "base64",
@@ -206,14 +243,15 @@ def parse_data_uri(value: str, *, budget: DecodeBudget | None = None) -> dict[st
             "reason": "input_too_large",
             "input_len": len(raw),
         }
-    match = _DATA_URI_RE.match(raw)
-    if not match:
+    # Manual split instead of a regex: the payload after the comma can be
+    # many KB, and the old nested non-greedy pattern backtracked over it.
+    comma = raw.find(",", 5)
+    if comma < 0:
         return {"status": "error", "reason": "invalid_data_uri"}
-
-    mime = (match.group("mime") or "").strip().lower()
-    params = (match.group("params") or "").lower()
-    data = match.group("data") or ""
-    is_base64 = ";base64" in params
+    header = raw[5:comma].lower().split(";")
+    mime = header[0].strip()
+    is_base64 = any(param.strip() == "base64" for param in header[1:])
+    data = raw[comma + 1 :]
 
     decoded_bytes = b""
     decoded_text_sample = ""
@@ -260,12 +298,21 @@ def analyze_url_obfuscation(url: str, *, budget: DecodeBudget | None = None) ->
     if not query:
         return {"url": raw, "query_param_count": 0, "flags": [], "nested_urls": [], "decoded_params_sample": []}
 
-    pairs = parse_qsl(query, keep_blank_values=True)
-    if len(pairs) > cfg.max_query_params:
-        pairs = pairs[: cfg.max_query_params]
+    # Plain split instead of parse_qsl: the decode pipeline below already
+    # percent-decodes values under budget, so the urllib unquoting machinery
+    # would do the same work twice. maxsplit parks everything past the cap in
+    # one trailing segment that is then dropped.
+    parts = query.split("&", cfg.max_query_params)
+    if len(parts) > cfg.max_query_params:
+        parts = parts[: cfg.max_query_params]
         truncated_params = True
     else:
         truncated_params = False
+    pairs: list[tuple[str, str]] = []
+    for part in parts:
+        if part:
+            param_key, _, param_value = part.partition("=")
+            pairs.append((param_key, param_value))
 
     flags: set[str] = set()
     nested: list[str] = []
@@ -280,42 +327,66 @@ def analyze_url_obfuscation(url: str, *, budget: DecodeBudget | None = None) ->
     for key, value in pairs:
         if not value:
             continue
-        raw_value, raw_value_truncated = _clip_text(str(value), cfg.max_param_value_chars)
+        value = str(value)
+        # Cheap pre-filter: a short value with no escape markers and no URL
+        # scheme cannot decode, nest a URL, or pass the base64 length floor,
+        # so the full analysis pipeline would mark it uninteresting anyway.
+        # The scheme probe must ignore case like URL_PATTERN does — the value
+        # is under 16 chars here, so lowering it stays cheap.
+        if len(value) < 16 and "%" not in value and "&" not in value and "http" not in value.lower():
+            continue
+        raw_value, raw_value_truncated = _clip_text(value, cfg.max_param_value_chars)
         analysis = normalize_text_layers(raw_value, budget=cfg)
 
         interesting = bool(analysis["decode_steps"]) or analysis["percent_encoded_sequences"] or raw_value_truncated
         decoded_value = str(analysis["normalized_sample"] or "")
 
-        found_urls = extract_urls(decoded_value)
+        # Every URL match contains a literal "://" regardless of case; a
+        # memchr-fast probe lets params without URLs skip the regex sweep.
+        found_urls = extract_urls(decoded_value) if "://" in decoded_value else []
         if found_urls:
             flags.add("nested_url_in_query")
             nested.extend(found_urls)
             interesting = True
 
-        base64_report = try_decode_base64_text(decoded_value, budget=cfg) or try_decode_base64_text(raw_value, budget=cfg)
+        base64_report = try_decode_base64_text(decoded_value, budget=cfg)
+        if base64_report is None and decoded_value != raw_value:
+            base64_report = try_decode_base64_text(raw_value, budget=cfg)
         if isinstance(base64_report, dict) and base64_report.get("status") == "ok":
             decoded_text = str(base64_report.get("text_sample") or "")
-            if "http://" in decoded_text or "https://" in decoded_text or "<html" in decoded_text.lower():
+            if _URL_OR_HTML_RE.search(decoded_text):
                 flags.add("base64_decoded_query_value")
                 nested.extend(extract_urls(decoded_text))
                 interesting = True
 
         if interesting and len(param_samples) < cfg.max_param_samples:
+            # Inline clipping here: only the text is needed, so the tuple
+            # from _clip_text would be built just to index [0].
+            key_text = str(key)
             entry: dict[str, Any] = {
-                "key": _clip_text(str(key), 80)[0],
+                "key": key_text if len(key_text) <= 80 else key_text[:80],
                 "value_sample": raw_value,
                 "value_truncated": bool(raw_value_truncated),
-                "normalized_sample": _clip_text(decoded_value, 600)[0],
+                "normalized_sample": decoded_value if len(decoded_value) <= 600 else decoded_value[:600],
                 "decode_steps": list(analysis.get("decode_steps", [])),
             }
             if base64_report:
                 entry["base64"] = base64_report
             param_samples.append(entry)
 
-    nested = list(dict.fromkeys(item for item in nested if item))
-    if len(nested) > cfg.max_nested_urls:
-        nested = nested[: cfg.max_nested_urls]
-        flags.add("nested_url_cap_hit")
+    # Dedup and cap in one pass; the old dict.fromkeys round-trip built the
+    # full distinct list before trimming it.
+    seen_nested: set[str] = set()
+    deduped_nested: list[str] = []
+    for item in nested:
+        if not item or item in seen_nested:
+            continue
+        if len(deduped_nested) >= cfg.max_nested_urls:
+            flags.add("nested_url_cap_hit")
+            break
+        seen_nested.add(item)
+        deduped_nested.append(item)
+    nested = deduped_nested
 
     return {
         "url": raw,
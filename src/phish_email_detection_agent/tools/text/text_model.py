@@ -6,6 +6,12 @@ import re
 from typing import Any
 
 
+PHISHING_KEYWORDS = ("verify", "password", "urgent", "invoice", "wire transfer")
+# One alternation pass over the body instead of one substring scan per keyword.
+_PHISHING_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in PHISHING_KEYWORDS), re.IGNORECASE
+)
+
 _SPAM_PROMO_TOKENS = (
     "unsubscribe",
     "newsletter",
@@ -22,21 +28,39 @@ _SPAM_PROMO_TOKENS = (
     "work from home",
     "crypto giveaway",
 )
-_SPAM_ACTION_PATTERNS = (
-    re.compile(r"\bclick here\b"),
-    re.compile(r"\bshop now\b"),
-    re.compile(r"\bclaim (?:your )?(?:offer|reward|prize)\b"),
-    re.compile(r"\bsubscribe\b"),
-)
+# Single alternations so the (subject + body) blob is scanned once per
+# signal family instead of once per token/pattern.
+_SPAM_PROMO_RE = re.compile("|".join(re.escape(token) for token in _SPAM_PROMO_TOKENS))
+_SPAM_ACTION_RE = re.compile(r"\b(?:click here|shop now|claim (?:your )?(?:offer|reward|prize)|subscribe)\b")
+
+
+# Single substitution pass; split()+join builds a token list per call.
+_WS_RE = re.compile(r"\s+")
 
 
 def normalize_text(value: str) -> str:
-    return " ".join((value or "").split()).strip()
+    return _WS_RE.sub(" ", value or "").strip()
 
 
 def contains_phishing_keywords(value: str) -> bool:
-    text = (value or "").lower()
-    return any(k in text for k in ("verify", "password", "urgent", "invoice", "wire transfer"))
+    return _PHISHING_KEYWORD_RE.search(value or "") is not None
+
+
+def keyword_scan_core(value: str) -> tuple[bool, list[str]]:
+    """Lowercase once and return (is_suspicious, matched keywords)."""
+    lowered = (value or "").lower()
+    matches = [keyword for keyword in PHISHING_KEYWORDS if keyword in lowered]
+    return bool(matches), matches
+
+
+def _has_three_bangs(text: str) -> bool:
+    """True once three ! are found; stops early instead of counting them all."""
+    idx = -1
+    for _ in range(3):
+        idx = text.find("!", idx + 1)
+        if idx < 0:
+            return False
+    return True
 
 
 def _spam_signal_score(
@@ -46,9 +70,14 @@ def _spam_signal_score(
     urls: list[str] | None = None,
 ) -> int:
     lowered = f"{subject}\n{text}".lower()
-    score = sum(1 for token in _SPAM_PROMO_TOKENS if token in lowered)
-    score += sum(1 for pattern in _SPAM_ACTION_PATTERNS if pattern.search(lowered))
-    if lowered.count("!") >= 3:
+    # Distinct matches keep the old one-point-per-token/pattern scoring; the
+    # claim variants fold into one bucket like the original single pattern.
+    promo_hits = set(_SPAM_PROMO_RE.findall(lowered))
+    action_hits = {
+        "claim" if match.startswith("claim") else match for match in _SPAM_ACTION_RE.findall(lowered)
+    }
+    score = len(promo_hits) + len(action_hits)
+    if _has_three_bangs(lowered):
         score += 1
     if len(urls or []) >= 2:
         score += 1
@@ -4,7 +4,14 @@ from phish_email_detection_agent.tools.url_fetch.service import (
     SafeFetchPolicy,
     analyze_html_content,
     analyze_url_target,
+    analyze_url_targets,
     safe_fetch_url,
 )
 
-__all__ = ["SafeFetchPolicy", "safe_fetch_url", "analyze_html_content", "analyze_url_target"]
+__all__ = [
+    "SafeFetchPolicy",
+    "safe_fetch_url",
+    "analyze_html_content",
+    "analyze_url_target",
+    "analyze_url_targets",
+]
@@ -13,13 +13,62 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from html.parser import HTMLParser
+import re
 from typing import Any
-from urllib.parse import urlparse
 
 from phish_email_detection_agent.tools.text.encoding import DecodeBudget, normalize_text_layers, parse_data_uri
 
 _SKIP_TEXT_TAGS = {"script", "style", "noscript"}
 
+# Single C-level substitution per text run; split()+join allocates a token
+# list for every one, and most runs are only a few words.
+_WS_RE = re.compile(r"\s+")
+
+# Snippet-ranking tokens folded into one scan per fragment. Tokens that used
+# to share an `or` branch share a bucket so they still score once per pair;
+# the lookahead keeps substring semantics for occurrences the alternation
+# would otherwise consume (non-overlapping matching).
+_SNIPPET_TOKEN_BUCKET = {
+    "password": "password",
+    "verify": "verify",
+    "login": "login",
+    "mfa": "mfa_otp",
+    "otp": "mfa_otp",
+    "invoice": "billing",
+    "payment": "billing",
+    "urgent": "urgency",
+    "immediately": "urgency",
+}
+_SNIPPET_BUCKET_WEIGHT = {
+    "password": 5,
+    "verify": 4,
+    "login": 4,
+    "mfa_otp": 3,
+    "billing": 3,
+    "urgency": 2,
+}
+_SNIPPET_TOKEN_RE = re.compile("(?=(" + "|".join(_SNIPPET_TOKEN_BUCKET) + "))")
+
+_SUSPICIOUS_TOKENS = (
+    "verify account",
+    "password",
+    "urgent",
+    "suspended",
+    "security check",
+    "wallet",
+    "invoice",
+    "mfa",
+)
+_BRAND_TOKENS = ("microsoft", "paypal", "apple", "google", "dhl", "amazon", "bank")
+# One pass over the normalized text instead of 15 sequential substring scans.
+_CONTENT_TOKEN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(token) for token in _SUSPICIOUS_TOKENS + _BRAND_TOKENS) + "))"
+)
+# Existence-only prescreen for the snippet ranking loop. Brand tokens are
+# included because a dynamic-keyword hit alone can put a fragment on the
+# board.
+_SNIPPET_PRESCREEN_RE = re.compile("|".join(tuple(_SNIPPET_TOKEN_BUCKET) + _BRAND_TOKENS))
+
 
 @dataclass(frozen=True)
 class HtmlCompactionPolicy:
@@ -46,17 +95,63 @@ def _clip_text(value: str, max_chars: int) -> str:
     return text[:max_chars]
 
 
+def _dedupe(values: list[str], limit: int) -> list[str]:
+    """Order-preserving dedupe that stops once ``limit`` items are kept."""
+    if limit <= 0:
+        return []
+    seen: set[str] = set()
+    out: list[str] = []
+    for value in values:
+        if value in seen:
+            continue
+        seen.add(value)
+        out.append(value)
+        if len(out) >= limit:
+            break
+    return out
+
+
+def _attr(attrs: list[tuple[str, str | None]], name: str) -> str:
+    """Return one attribute value without building a full attr dict.
+
+    Last occurrence wins, matching the dict-comprehension semantics this
+    replaces.
+    """
+    found = ""
+    for key, value in attrs:
+        if key == name:
+            found = value or ""
+    return found
+
+
+def _attr_pair(attrs: list[tuple[str, str | None]], first: str, second: str) -> tuple[str, str]:
+    """Like ``_attr`` but fetches two attributes in the same pass."""
+    a = b = ""
+    for key, value in attrs:
+        if key == first:
+            a = value or ""
+        elif key == second:
+            b = value or ""
+    return a, b
+
+
 def _is_external_ref(value: str) -> bool:
-    raw = (value or "").strip().lower()
-    return raw.startswith(("http://", "https://", "//"))
+    # Callers pass already-stripped values; lowercasing only the 8-char
+    # prefix avoids copying what can be a very long href on every attribute.
+    if not value:
+        return False
+    return value[:8].lower().startswith(("http://", "https://", "//"))
+
+
+# _is_external_ref only admits http://, https:// and scheme-relative //
+# values, so a single authority match replaces the multi-pass pure-Python
+# urlparse walk for the hot dedup path.
+_HOST_RE = re.compile(r"^(?:[a-zA-Z][a-zA-Z0-9+.\-]*:)?//(?:[^/?#@]*@)?([^/?#:]+)")
 
 
 def _maybe_extract_domain(value: str) -> str:
-    try:
-        parsed = urlparse(value)
-    except Exception:
-        return ""
-    return (parsed.hostname or "").lower()
+    match = _HOST_RE.match(value.strip())
+    return match.group(1).lower() if match else ""
 
 
 class _HtmlCompactor(HTMLParser):
@@ -77,7 +172,13 @@ class _HtmlCompactor(HTMLParser):
         self.meta_refresh = False
 
         self.text_fragments: list[str] = []
+        # Lowercased in lockstep so the snippet ranker never relowers.
+        self.text_fragments_lower: list[str] = []
         self._visible_text_len = 0
+        # Hot-path bounds hoisted out of the dataclass; _add_text_fragment
+        # runs once per text node and the attribute chase adds up.
+        self._max_fragments = int(policy.max_fragments)
+        self._max_visible_text_chars = int(policy.max_visible_text_chars)
 
         self.outbound_links: list[str] = []
         self.external_script_srcs: list[str] = []
@@ -88,80 +189,108 @@ class _HtmlCompactor(HTMLParser):
     def _add_text_fragment(self, text: str) -> None:
         if not text:
             return
-        if len(self.text_fragments) >= self.policy.max_fragments:
+        if len(self.text_fragments) >= self._max_fragments:
             return
-        remaining = max(0, int(self.policy.max_visible_text_chars) - self._visible_text_len)
+        remaining = max(0, self._max_visible_text_chars - self._visible_text_len)
         if remaining <= 0:
             return
         clipped = text if len(text) <= remaining else text[:remaining]
         if clipped:
             self.text_fragments.append(clipped)
+            self.text_fragments_lower.append(clipped.lower())
             self._visible_text_len += len(clipped)
 
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        lower = tag.lower()
-        attr_map = {k.lower(): (v or "") for k, v in attrs}
+    def _start_form(self, attrs: list[tuple[str, str | None]]) -> None:
+        self.form_count += 1
+        action = _attr(attrs, "action").strip()
+        if action and len(self.form_actions) < self.policy.max_form_actions:
+            self.form_actions.append(_clip_text(action, 300))
+
+    def _start_input(self, attrs: list[tuple[str, str | None]]) -> None:
+        input_type, input_name = _attr_pair(attrs, "type", "name")
+        input_type = input_type.strip().lower()
+        input_name = input_name.strip().lower()
+        if input_type == "password":
+            self.password_fields += 1
+        if "otp" in input_type or "otp" in input_name or "code" in input_name:
+            self.otp_fields += 1
+
+    def _start_iframe(self, attrs: list[tuple[str, str | None]]) -> None:
+        self.iframe_count += 1
+
+    def _start_script(self, attrs: list[tuple[str, str | None]]) -> None:
+        src = _attr(attrs, "src").strip()
+        if src and _is_external_ref(src):
+            self.external_scripts += 1
+            if len(self.external_script_srcs) < self.policy.max_external_scripts:
+                self.external_script_srcs.append(_clip_text(src, 300))
+
+    def _start_link(self, attrs: list[tuple[str, str | None]]) -> None:
+        href = _attr(attrs, "href").strip()
+        if href and _is_external_ref(href):
+            self.external_links += 1
+            if len(self.outbound_links) < self.policy.max_outbound_links:
+                self.outbound_links.append(_clip_text(href, 500))
+
+    def _start_meta(self, attrs: list[tuple[str, str | None]]) -> None:
+        http_equiv, content = _attr_pair(attrs, "http-equiv", "content")
+        http_equiv = http_equiv.strip().lower()
+        content = content.strip()
+        if http_equiv == "refresh" and content:
+            self.meta_refresh = True
+            if len(self.meta_refresh_targets) < self.policy.max_meta_refresh_targets:
+                self.meta_refresh_targets.append(_clip_text(content, 240))
+
+    # One dict lookup instead of a compare chain per tag; the common
+    # div/span/p tags miss straight to the data-URI scan.
+    _TAG_HANDLERS = {
+        "form": _start_form,
+        "input": _start_input,
+        "iframe": _start_iframe,
+        "script": _start_script,
+        "a": _start_link,
+        "link": _start_link,
+        "meta": _start_meta,
+    }
 
-        if lower == "title":
+    # Both parser backends (html.parser and libxml2's HTML parser) deliver
+    # tag and attribute names already lowercased, so the handlers compare
+    # them directly instead of relowering every name.
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "title":
             self._in_title = True
             return
 
-        if lower in _SKIP_TEXT_TAGS:
+        if tag in _SKIP_TEXT_TAGS:
             self._skip_text_depth += 1
 
-        if lower == "form":
-            self.form_count += 1
-            action = (attr_map.get("action") or "").strip()
-            if action and len(self.form_actions) < self.policy.max_form_actions:
-                self.form_actions.append(_clip_text(action, 300))
-        elif lower == "input":
-            input_type = (attr_map.get("type") or "").strip().lower()
-            input_name = (attr_map.get("name") or "").strip().lower()
-            if input_type == "password":
-                self.password_fields += 1
-            if "otp" in input_type or "otp" in input_name or "code" in input_name:
-                self.otp_fields += 1
-        elif lower == "iframe":
-            self.iframe_count += 1
-        elif lower == "script":
-            src = (attr_map.get("src") or "").strip()
-            if src and _is_external_ref(src):
-                self.external_scripts += 1
-                if len(self.external_script_srcs) < self.policy.max_external_scripts:
-                    self.external_script_srcs.append(_clip_text(src, 300))
-        elif lower in {"a", "link"}:
-            href = (attr_map.get("href") or "").strip()
-            if href and _is_external_ref(href):
-                self.external_links += 1
-                if len(self.outbound_links) < self.policy.max_outbound_links:
-                    self.outbound_links.append(_clip_text(href, 500))
-        elif lower == "meta":
-            http_equiv = (attr_map.get("http-equiv") or "").strip().lower()
-            content = (attr_map.get("content") or "").strip()
-            if http_equiv == "refresh" and content:
-                self.meta_refresh = True
-                if len(self.meta_refresh_targets) < self.policy.max_meta_refresh_targets:
-                    self.meta_refresh_targets.append(_clip_text(content, 240))
+        handler = self._TAG_HANDLERS.get(tag)
+        if handler is not None:
+            handler(self, attrs)
 
         # Data URIs commonly appear in img/src, a/href, iframe/src, etc.
+        # Only the 5-char prefix is lowercased, not the whole (possibly huge)
+        # attribute value.
         if len(self.data_uri_values) < self.policy.max_data_uri_reports:
-            for value in attr_map.values():
-                if value and value.strip().lower().startswith("data:"):
-                    self.data_uri_values.append(_clip_text(value.strip(), 1200))
+            for _, value in attrs:
+                if not value:
+                    continue
+                stripped = value.strip()
+                if stripped[:5].lower() == "data:":
+                    self.data_uri_values.append(_clip_text(stripped, 1200))
                     if len(self.data_uri_values) >= self.policy.max_data_uri_reports:
                         break
 
     def handle_endtag(self, tag: str) -> None:
-        lower = tag.lower()
-        if lower == "title":
+        if tag == "title":
             self._in_title = False
-        if lower in _SKIP_TEXT_TAGS and self._skip_text_depth > 0:
+        if tag in _SKIP_TEXT_TAGS and self._skip_text_depth > 0:
             self._skip_text_depth -= 1
 
     def handle_data(self, data: str) -> None:
-        clean = " ".join((data or "").split())
-        if not clean:
+        if not data or data.isspace():
             return
+        clean = _WS_RE.sub(" ", data).strip()
         if self._in_title and not self.title:
             self.title = clean[:160]
         if self._skip_text_depth > 0:
@@ -169,21 +298,78 @@ class _HtmlCompactor(HTMLParser):
         self._add_text_fragment(clean)
 
 
-def _rank_snippets(fragments: list[str], *, policy: HtmlCompactionPolicy, keywords: set[str]) -> list[str]:
+class _LxmlTarget:
+    """Adapt lxml's target-parser events onto an ``_HtmlCompactor``.
+
+    lxml delivers attributes as a dict; like html.parser, libxml2's HTML
+    mode lowercases tag and attribute names, so both parse paths hand the
+    compactor identical events.
+    """
+
+    def __init__(self, compactor: _HtmlCompactor) -> None:
+        self._compactor = compactor
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._compactor.handle_starttag(tag, list(attrib.items()))
+
+    def end(self, tag: str) -> None:
+        self._compactor.handle_endtag(tag)
+
+    def data(self, text: str) -> None:
+        self._compactor.handle_data(text)
+
+    def comment(self, text: str) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _parse_html(html_text: str, policy: HtmlCompactionPolicy) -> _HtmlCompactor:
+    """Run the compactor over ``html_text``, preferring the lxml tokenizer.
+
+    lxml (optional ``perf`` extra) moves the hot tokenizer loop into libxml2;
+    the stdlib ``HTMLParser`` path remains the default when it is missing or
+    chokes on the input.
+    """
+    compactor = _HtmlCompactor(policy)
+    try:
+        import lxml.etree  # noqa: PLC0415
+    except Exception:
+        compactor.feed(html_text or "")
+        return compactor
+
+    parser = lxml.etree.HTMLParser(target=_LxmlTarget(compactor), recover=True)
+    try:
+        parser.feed(html_text or "")
+        parser.close()
+    except Exception:
+        compactor = _HtmlCompactor(policy)
+        compactor.feed(html_text or "")
+    return compactor
+
+
+def _rank_snippets(
+    fragments: list[str],
+    fragments_lower: list[str],
+    *,
+    policy: HtmlCompactionPolicy,
+    keywords: set[str],
+) -> list[str]:
     candidates: list[tuple[int, int, str]] = []
-    for idx, fragment in enumerate(fragments):
-        lowered = fragment.lower()
-        score = 0
-        score += 5 if "password" in lowered else 0
-        score += 4 if "verify" in lowered else 0
-        score += 4 if "login" in lowered else 0
-        score += 3 if "mfa" in lowered or "otp" in lowered else 0
-        score += 3 if "invoice" in lowered or "payment" in lowered else 0
-        score += 2 if "urgent" in lowered or "immediately" in lowered else 0
-        score += 2 if any(token in lowered for token in keywords) else 0
-        if score <= 0:
-            continue
-        candidates.append((score, idx, fragment))
+    # One C-level scan over the bounded joined text decides whether any
+    # fragment can score at all; token-less pages (the common benign case)
+    # skip straight to the positional fallback. Tokens contain no spaces, so
+    # the join cannot fabricate a cross-fragment match.
+    if _SNIPPET_PRESCREEN_RE.search(" ".join(fragments_lower)) is not None:
+        for idx, fragment in enumerate(fragments):
+            lowered = fragments_lower[idx]
+            buckets = {_SNIPPET_TOKEN_BUCKET[token] for token in _SNIPPET_TOKEN_RE.findall(lowered)}
+            score = sum(_SNIPPET_BUCKET_WEIGHT[bucket] for bucket in buckets)
+            score += 2 if any(token in lowered for token in keywords) else 0
+            if score <= 0:
+                continue
+            candidates.append((score, idx, fragment))
 
     candidates.sort(key=lambda item: (-item[0], item[1]))
     selected: list[str] = []
@@ -196,33 +382,16 @@ def _rank_snippets(fragments: list[str], *, policy: HtmlCompactionPolicy, keywor
 
 def compact_html(html_text: str, *, policy: HtmlCompactionPolicy | None = None) -> dict[str, Any]:
     cfg = policy or HtmlCompactionPolicy()
-    parser = _HtmlCompactor(cfg)
-    parser.feed(html_text or "")
+    parser = _parse_html(html_text or "", cfg)
 
     visible_text = " ".join(parser.text_fragments)
     normalized = normalize_text_layers(visible_text, budget=cfg.decode_budget)
     normalized_text = str(normalized.get("normalized_sample") or "")
 
     full_text_lower = normalized_text.lower()
-    suspicious_keywords = [
-        token
-        for token in (
-            "verify account",
-            "password",
-            "urgent",
-            "suspended",
-            "security check",
-            "wallet",
-            "invoice",
-            "mfa",
-        )
-        if token in full_text_lower
-    ]
-    brand_hits = [
-        token
-        for token in ("microsoft", "paypal", "apple", "google", "dhl", "amazon", "bank")
-        if token in full_text_lower
-    ]
+    token_hits = set(_CONTENT_TOKEN_RE.findall(full_text_lower))
+    suspicious_keywords = [token for token in _SUSPICIOUS_TOKENS if token in token_hits]
+    brand_hits = [token for token in _BRAND_TOKENS if token in token_hits]
 
     data_uri_reports: list[dict[str, Any]] = []
     for value in parser.data_uri_values[: cfg.max_data_uri_reports]:
@@ -235,20 +404,24 @@ def compact_html(html_text: str, *, policy: HtmlCompactionPolicy | None = None)
         for domain in (_maybe_extract_domain(item) for item in parser.outbound_links + parser.external_script_srcs)
         if domain
     ]
-    outbound_domains = list(dict.fromkeys(outbound_domains))
 
-    snippets = _rank_snippets(parser.text_fragments, policy=cfg, keywords=set(brand_hits))
+    snippets = _rank_snippets(
+        parser.text_fragments,
+        parser.text_fragments_lower,
+        policy=cfg,
+        keywords=set(brand_hits),
+    )
 
     return {
         "title": parser.title,
         "visible_text_sample": _clip_text(visible_text, cfg.max_visible_text_chars),
         "snippets": snippets,
-        "outbound_links": list(dict.fromkeys(parser.outbound_links))[: cfg.max_outbound_links],
-        "outbound_domains": outbound_domains[: cfg.max_outbound_links],
-        "external_script_srcs": list(dict.fromkeys(parser.external_script_srcs))[: cfg.max_external_scripts],
-        "form_actions": list(dict.fromkeys(parser.form_actions))[: cfg.max_form_actions],
+        "outbound_links": _dedupe(parser.outbound_links, cfg.max_outbound_links),
+        "outbound_domains": _dedupe(outbound_domains, cfg.max_outbound_links),
+        "external_script_srcs": _dedupe(parser.external_script_srcs, cfg.max_external_scripts),
+        "form_actions": _dedupe(parser.form_actions, cfg.max_form_actions),
         "meta_refresh": bool(parser.meta_refresh),
-        "meta_refresh_targets": list(dict.fromkeys(parser.meta_refresh_targets))[: cfg.max_meta_refresh_targets],
+        "meta_refresh_targets": _dedupe(parser.meta_refresh_targets, cfg.max_meta_refresh_targets),
         "data_uri_reports": data_uri_reports,
         "decode": normalized,
         "features": {
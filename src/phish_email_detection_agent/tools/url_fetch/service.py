@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import base64
+import codecs
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
+import http.client
 import ipaddress
 import json
 from pathlib import Path
-import shlex
+import select
 import socket
+import ssl
 import subprocess
 import sys
+import threading
+import time
 from typing import Any
-from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlparse
-from urllib.request import HTTPErrorProcessor, Request, build_opener
+import urllib.request
 
 from phish_email_detection_agent.tools.text.encoding import analyze_url_obfuscation
 from phish_email_detection_agent.tools.url_fetch.html_compaction import compact_html
@@ -36,11 +43,122 @@ class SafeFetchPolicy:
     docker_workdir: str = "/workspace"
 
 
-class _NoRedirect(HTTPErrorProcessor):
-    def http_response(self, request, response):  # type: ignore[no-untyped-def]
-        return response
-
-    https_response = http_response
+# Idle keep-alive connections keyed by (scheme, host, port, proxy). Reusing
+# a connection skips the TCP+TLS handshake on every redirect hop and repeated
+# host, which dominates wall time for short responses.
+_CONN_POOL: dict[tuple, list[http.client.HTTPConnection]] = {}
+_CONN_POOL_LOCK = threading.Lock()
+_CONN_POOL_MAX_IDLE = 4
+
+# One shared TLS context: create_default_context loads the CA bundle from
+# disk and compiles the cipher list, which is wasted work per connection.
+# Built lazily so importing the module stays cheap.
+_SSL_CTX: ssl.SSLContext | None = None
+
+
+def _ssl_context() -> ssl.SSLContext:
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        ctx = ssl.create_default_context()
+        ctx.set_alpn_protocols(["http/1.1"])
+        _SSL_CTX = ctx
+    return _SSL_CTX
+
+
+def _proxy_endpoint(scheme: str, host: str) -> tuple[str, int, str | None] | None:
+    """Return (host, port, auth header) for the configured proxy, if any.
+
+    Mirrors what the urllib opener honored before the pooled path replaced
+    it: http_proxy/https_proxy select the proxy per scheme, no_proxy bypasses
+    it per host, and credentials embedded in the proxy URL become a basic
+    Proxy-Authorization header. PAC files and SOCKS proxies are not
+    supported. The environment is re-read per request so changes take effect
+    without a restart; the scan is negligible next to a network round trip.
+    """
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return None
+    parsed = urlparse(proxy_url)
+    if not parsed.hostname:
+        return None
+    auth = None
+    if parsed.username:
+        creds = f"{parsed.username}:{parsed.password or ''}"
+        auth = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    return parsed.hostname, parsed.port or 80, auth
+
+
+def _get_conn(
+    scheme: str, host: str, port: int, timeout_s: float
+) -> tuple[http.client.HTTPConnection, bool]:
+    """Return a (connection, was_pooled) pair for the target origin."""
+    proxy = _proxy_endpoint(scheme, host)
+    with _CONN_POOL_LOCK:
+        idle = _CONN_POOL.get((scheme, host, port, proxy))
+        if idle:
+            return idle.pop(), True
+    if proxy is not None:
+        proxy_host, proxy_port, proxy_auth = proxy
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                proxy_host, proxy_port, timeout=timeout_s, context=_ssl_context()
+            )
+            conn.set_tunnel(host, port, headers={"Proxy-Authorization": proxy_auth} if proxy_auth else None)
+            return conn, False
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout_s), False
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout_s, context=_ssl_context()), False
+    return http.client.HTTPConnection(host, port, timeout=timeout_s), False
+
+
+def _put_conn(scheme: str, host: str, port: int, conn: http.client.HTTPConnection) -> None:
+    key = (scheme, host, port, _proxy_endpoint(scheme, host))
+    with _CONN_POOL_LOCK:
+        idle = _CONN_POOL.setdefault(key, [])
+        if len(idle) < _CONN_POOL_MAX_IDLE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _recycle_response(
+    scheme: str, host: str, port: int, conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+) -> None:
+    """Drain a small remaining body and pool the connection if reusable."""
+    try:
+        response.read(65536)
+        if response.isclosed() and not response.will_close:
+            _put_conn(scheme, host, port, conn)
+            return
+    except OSError:
+        pass
+    conn.close()
+
+
+def _open_request(
+    scheme: str, host: str, port: int, path_qs: str, cfg: SafeFetchPolicy
+) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Issue one GET, retrying with a fresh connection if a pooled one is stale."""
+    headers = {"User-Agent": cfg.user_agent, "Connection": "keep-alive"}
+    request_target = path_qs
+    proxy = _proxy_endpoint(scheme, host)
+    if proxy is not None and scheme == "http":
+        # A plain-HTTP proxy expects the absolute URI; HTTPS runs through a
+        # CONNECT tunnel instead and keeps the origin-form target.
+        request_target = f"http://{host}:{port}{path_qs}"
+        if proxy[2]:
+            headers["Proxy-Authorization"] = proxy[2]
+    while True:
+        conn, pooled = _get_conn(scheme, host, port, cfg.timeout_s)
+        try:
+            conn.request("GET", request_target, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+            # A kept-alive peer may have closed between requests; only a
+            # pooled connection earns a retry.
+            conn.close()
+            if not pooled:
+                raise
 
 
 def _repo_root() -> Path:
@@ -48,19 +166,65 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[4]
 
 
+# ipaddress.ip_address allocates and walks several property chains per call;
+# the same resolver answers repeat constantly, so classification is memoized
+# by raw address string. Lookups stay lock-free; only the evict-then-insert
+# needs the lock, since analyze_url_targets reaches here from worker threads.
+_IP_PRIVATE_CACHE: dict[str, bool] = {}
+_IP_PRIVATE_CACHE_LOCK = threading.Lock()
+_IP_PRIVATE_CACHE_MAX = 1024
+
+
 def _is_private_ip(addr: str) -> bool:
+    cached = _IP_PRIVATE_CACHE.get(addr)
+    if cached is not None:
+        return cached
     try:
         ip = ipaddress.ip_address(addr)
     except ValueError:
-        return False
-    return (
-        ip.is_private
-        or ip.is_loopback
-        or ip.is_multicast
-        or ip.is_reserved
-        or ip.is_link_local
-        or ip.is_unspecified
-    )
+        private = False
+    else:
+        private = (
+            ip.is_private
+            or ip.is_loopback
+            or ip.is_multicast
+            or ip.is_reserved
+            or ip.is_link_local
+            or ip.is_unspecified
+        )
+    with _IP_PRIVATE_CACHE_LOCK:
+        if len(_IP_PRIVATE_CACHE) >= _IP_PRIVATE_CACHE_MAX:
+            _IP_PRIVATE_CACHE.pop(next(iter(_IP_PRIVATE_CACHE)))
+        _IP_PRIVATE_CACHE[addr] = private
+    return private
+
+
+# Resolved addresses per host with a short TTL; redirect chains and repeated
+# checks against the same host (the common case) skip the getaddrinfo
+# syscall, which can dominate latency for short responses. Failures are not
+# cached so transient DNS errors stay transient.
+_DNS_CACHE: dict[str, tuple[float, list[str]]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_DNS_CACHE_TTL_S = 60.0
+_DNS_CACHE_MAX = 256
+
+
+def _resolve_host(host: str) -> list[str]:
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(host)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+    # SOCK_STREAM + AI_ADDRCONFIG keep getaddrinfo from enumerating per-
+    # protocol duplicates and families this host cannot route. Resolution
+    # happens outside the lock so a slow lookup never stalls other threads.
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM, flags=socket.AI_ADDRCONFIG)
+    addrs = [entry[4][0] for entry in infos]
+    with _DNS_CACHE_LOCK:
+        if len(_DNS_CACHE) >= _DNS_CACHE_MAX:
+            _DNS_CACHE.pop(next(iter(_DNS_CACHE)))
+        _DNS_CACHE[host] = (now + _DNS_CACHE_TTL_S, addrs)
+    return addrs
 
 
 def _check_network_target(url: str, allow_private: bool) -> tuple[bool, str | None]:
@@ -72,126 +236,167 @@ def _check_network_target(url: str, allow_private: bool) -> tuple[bool, str | No
         return False, "missing_host"
 
     try:
-        infos = socket.getaddrinfo(host, None)
+        addrs = _resolve_host(host)
     except socket.gaierror:
         return False, "dns_resolution_failed"
 
-    for entry in infos:
-        addr = entry[4][0]
-        if not allow_private and _is_private_ip(addr):
-            return False, "private_network_blocked"
+    if not allow_private:
+        for addr in addrs:
+            if _is_private_ip(addr):
+                return False, "private_network_blocked"
     return True, None
 
 
-def _read_body(response, max_bytes: int) -> tuple[bytes, bool]:  # type: ignore[no-untyped-def]
-    chunks: list[bytes] = []
+def _read_text_body(response, max_bytes: int) -> tuple[str, bool]:  # type: ignore[no-untyped-def]
+    """Stream an HTML body through an incremental UTF-8 decoder.
+
+    Decoding per chunk overlaps with the network wait and never holds the raw
+    bytes and the decoded text at the same time, which matters for bodies at
+    the 1 MB cap.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    parts: list[str] = []
     total = 0
     truncated = False
     while True:
         block = response.read(min(65536, max_bytes - total + 1))
         if not block:
+            parts.append(decoder.decode(b"", True))
             break
-        chunks.append(block)
         total += len(block)
         if total > max_bytes:
             truncated = True
+            parts.append(decoder.decode(block[: max_bytes - total], True))
             break
-    data = b"".join(chunks)
-    if truncated:
-        data = data[:max_bytes]
-    return data, truncated
+        parts.append(decoder.decode(block))
+    return "".join(parts), truncated
 
 
 def _safe_fetch_url_internal(url: str, cfg: SafeFetchPolicy) -> dict[str, Any]:
-    opener = build_opener(_NoRedirect())
     redirect_chain: list[str] = []
     current = url
     final_status = 0
     html = ""
 
     for _ in range(cfg.max_redirects + 1):
-        req = Request(current, method="GET", headers={"User-Agent": cfg.user_agent})
+        parsed = urlparse(current)
+        scheme = parsed.scheme
+        host = parsed.hostname or ""
+        port = parsed.port or (443 if scheme == "https" else 80)
+        path_qs = parsed.path or "/"
+        if parsed.query:
+            path_qs = f"{path_qs}?{parsed.query}"
+
         try:
-            with opener.open(req, timeout=cfg.timeout_s) as response:
-                status = int(getattr(response, "status", 200))
-                final_status = status
-                headers = response.headers
-                location = headers.get("Location")
-                if location and status in {301, 302, 303, 307, 308}:
-                    next_url = urljoin(current, location)
-                    redirect_chain.append(next_url)
-                    current = next_url
-                    ok, reason = _check_network_target(current, cfg.allow_private_network)
-                    if not ok:
-                        return {
-                            "url": url,
-                            "final_url": current,
-                            "redirect_chain": redirect_chain,
-                            "status": "blocked",
-                            "blocked_reason": reason,
-                        }
-                    continue
-
-                raw_content_length = headers.get("Content-Length")
-                if raw_content_length and raw_content_length.isdigit():
-                    if int(raw_content_length) > cfg.max_bytes:
-                        return {
-                            "url": url,
-                            "final_url": current,
-                            "redirect_chain": redirect_chain,
-                            "status_code": status,
-                            "status": "blocked",
-                            "blocked_reason": "response_too_large",
-                        }
-
-                content_type = (headers.get("Content-Type") or "").lower()
-                if "application/x-msdownload" in content_type or "application/octet-stream" in content_type:
-                    return {
-                        "url": url,
-                        "final_url": current,
-                        "redirect_chain": redirect_chain,
-                        "status_code": status,
-                        "status": "blocked",
-                        "blocked_reason": "binary_download_blocked",
-                        "content_type": content_type,
-                    }
-
-                raw, truncated = _read_body(response, cfg.max_bytes)
-                if "html" in content_type:
-                    html = raw.decode("utf-8", errors="replace")
+            conn, response = _open_request(scheme, host, port, path_qs, cfg)
+        except TimeoutError:
+            return {
+                "url": url,
+                "final_url": current,
+                "redirect_chain": redirect_chain,
+                "status": "timeout",
+            }
+        except (OSError, http.client.HTTPException):
+            return {
+                "url": url,
+                "final_url": current,
+                "redirect_chain": redirect_chain,
+                "status": "network_error",
+            }
+
+        status = int(response.status)
+        final_status = status
+        headers = response.headers
+        location = headers.get("Location")
+        if location and status in {301, 302, 303, 307, 308}:
+            next_url = urljoin(current, location)
+            redirect_chain.append(next_url)
+            _recycle_response(scheme, host, port, conn, response)
+            current = next_url
+            ok, reason = _check_network_target(current, cfg.allow_private_network)
+            if not ok:
+                return {
+                    "url": url,
+                    "final_url": current,
+                    "redirect_chain": redirect_chain,
+                    "status": "blocked",
+                    "blocked_reason": reason,
+                }
+            continue
+
+        raw_content_length = headers.get("Content-Length")
+        if raw_content_length and raw_content_length.isdigit():
+            if int(raw_content_length) > cfg.max_bytes:
+                conn.close()
                 return {
                     "url": url,
                     "final_url": current,
                     "redirect_chain": redirect_chain,
-                    "status": "ok",
                     "status_code": status,
-                    "content_type": content_type,
-                    "truncated": truncated,
-                    "html": html,
+                    "status": "blocked",
+                    "blocked_reason": "response_too_large",
                 }
-        except HTTPError as exc:
-            final_status = int(exc.code)
+
+        content_type = (headers.get("Content-Type") or "").lower()
+        if "application/x-msdownload" in content_type or "application/octet-stream" in content_type:
+            conn.close()
             return {
                 "url": url,
                 "final_url": current,
                 "redirect_chain": redirect_chain,
-                "status": "http_error",
-                "status_code": final_status,
+                "status_code": status,
+                "status": "blocked",
+                "blocked_reason": "binary_download_blocked",
+                "content_type": content_type,
             }
-        except URLError:
+
+        if "html" not in content_type:
+            # Only HTML feeds the downstream analysis; skip streaming up to
+            # max_bytes of a body nothing will read.
+            conn.close()
             return {
                 "url": url,
                 "final_url": current,
                 "redirect_chain": redirect_chain,
-                "status": "network_error",
+                "status": "ok",
+                "status_code": status,
+                "content_type": content_type,
+                "truncated": False,
+                "html": "",
             }
+
+        try:
+            html, truncated = _read_text_body(response, cfg.max_bytes)
         except TimeoutError:
+            conn.close()
             return {
                 "url": url,
                 "final_url": current,
                 "redirect_chain": redirect_chain,
                 "status": "timeout",
             }
+        except OSError:
+            conn.close()
+            return {
+                "url": url,
+                "final_url": current,
+                "redirect_chain": redirect_chain,
+                "status": "network_error",
+            }
+        if truncated or response.will_close:
+            conn.close()
+        else:
+            _put_conn(scheme, host, port, conn)
+        return {
+            "url": url,
+            "final_url": current,
+            "redirect_chain": redirect_chain,
+            "status": "ok",
+            "status_code": status,
+            "content_type": content_type,
+            "truncated": truncated,
+            "html": html,
+        }
     return {
         "url": url,
         "final_url": current,
@@ -202,13 +407,12 @@ def _safe_fetch_url_internal(url: str, cfg: SafeFetchPolicy) -> dict[str, Any]:
     }
 
 
-def _worker_args(url: str, cfg: SafeFetchPolicy, python_cmd: str) -> list[str]:
+def _worker_args(cfg: SafeFetchPolicy, python_cmd: str) -> list[str]:
     args = [
         python_cmd,
         "-m",
         "phish_email_detection_agent.tools.url_fetch.worker",
-        "--url",
-        url,
+        "--serve",
         "--timeout",
         str(cfg.timeout_s),
         "--max-redirects",
@@ -223,26 +427,23 @@ def _worker_args(url: str, cfg: SafeFetchPolicy, python_cmd: str) -> list[str]:
     return args
 
 
-def _invoke_sandbox_worker(url: str, cfg: SafeFetchPolicy) -> dict[str, Any]:
-    backend = cfg.sandbox_backend.strip().lower()
-    repo_root = _repo_root()
-    command: list[str] = []
-
+def _sandbox_command(cfg: SafeFetchPolicy, backend: str) -> list[str]:
     if backend == "firejail":
-        command = [
+        return [
             cfg.firejail_bin,
             "--quiet",
             "--noprofile",
             "--private",
             "--caps.drop=all",
             "--seccomp",
-            *_worker_args(url, cfg, sys.executable),
+            *_worker_args(cfg, sys.executable),
         ]
-    elif backend == "docker":
-        command = [
+    if backend == "docker":
+        return [
             cfg.docker_bin,
             "run",
             "--rm",
+            "--interactive",
             "--network",
             "bridge",
             "--cpus",
@@ -259,75 +460,128 @@ def _invoke_sandbox_worker(url: str, cfg: SafeFetchPolicy) -> dict[str, Any]:
             "-e",
             "PYTHONPATH=/workspace/src",
             "-v",
-            f"{repo_root}:/workspace:ro",
+            f"{_repo_root()}:/workspace:ro",
             "-w",
             cfg.docker_workdir,
             cfg.docker_image,
-            *_worker_args(url, cfg, "python"),
+            *_worker_args(cfg, "python"),
         ]
-    else:
-        return {"url": url, "status": "blocked", "blocked_reason": "invalid_sandbox_backend"}
+    return []
 
-    try:
-        completed = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=cfg.sandbox_exec_timeout_s,
-            check=False,
-        )
-    except FileNotFoundError:
-        return {
-            "url": url,
-            "status": "sandbox_error",
-            "blocked_reason": "sandbox_backend_unavailable",
-            "sandbox_backend": backend,
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "url": url,
-            "status": "timeout",
-            "blocked_reason": "sandbox_execution_timeout",
-            "sandbox_backend": backend,
-        }
 
-    if completed.returncode != 0:
-        return {
-            "url": url,
-            "status": "sandbox_error",
-            "blocked_reason": "sandbox_worker_failed",
-            "sandbox_backend": backend,
-            "stderr": (completed.stderr or "")[:500],
-            "command": shlex.join(command[:8]),
-        }
+class _SandboxPool:
+    """Long-lived sandboxed fetch worker speaking one URL/JSON line per turn.
 
-    raw = (completed.stdout or "").strip()
-    if not raw:
-        return {
-            "url": url,
-            "status": "sandbox_error",
-            "blocked_reason": "sandbox_worker_empty_output",
-            "sandbox_backend": backend,
-        }
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError:
-        return {
-            "url": url,
-            "status": "sandbox_error",
-            "blocked_reason": "sandbox_worker_invalid_json",
-            "sandbox_backend": backend,
-            "stdout": raw[:500],
-        }
-    if not isinstance(payload, dict):
+    Spawning firejail or ``docker run`` per URL costs hundreds of ms of
+    startup; keeping one worker alive amortizes that across every URL an
+    email produces. A worker that dies or overruns its per-URL timeout is
+    killed and respawned on the next call.
+    """
+
+    def __init__(self, backend: str, command: list[str]) -> None:
+        self._backend = backend
+        self._command = command
+        self._proc: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    def _error(self, url: str, status: str, reason: str) -> dict[str, Any]:
         return {
             "url": url,
-            "status": "sandbox_error",
-            "blocked_reason": "sandbox_worker_invalid_payload",
-            "sandbox_backend": backend,
+            "status": status,
+            "blocked_reason": reason,
+            "sandbox_backend": self._backend,
         }
-    payload["sandbox_backend"] = backend
-    return payload
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except OSError:
+                pass
+            self._proc = None
+
+    def _ensure_process(self) -> subprocess.Popen[str]:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        return self._proc
+
+    def fetch(self, url: str, timeout_s: float) -> dict[str, Any]:
+        with self._lock:
+            try:
+                proc = self._ensure_process()
+            except FileNotFoundError:
+                return self._error(url, "sandbox_error", "sandbox_backend_unavailable")
+
+            try:
+                assert proc.stdin is not None and proc.stdout is not None
+                proc.stdin.write(url + "\n")
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError):
+                self._kill()
+                return self._error(url, "sandbox_error", "sandbox_worker_failed")
+
+            ready, _, _ = select.select([proc.stdout], [], [], timeout_s)
+            if not ready:
+                self._kill()
+                return self._error(url, "timeout", "sandbox_execution_timeout")
+
+            line = proc.stdout.readline().strip()
+            if not line:
+                self._kill()
+                return self._error(url, "sandbox_error", "sandbox_worker_empty_output")
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                self._kill()
+                report = self._error(url, "sandbox_error", "sandbox_worker_invalid_json")
+                report["stdout"] = line[:500]
+                return report
+            if not isinstance(payload, dict):
+                return self._error(url, "sandbox_error", "sandbox_worker_invalid_payload")
+            payload["sandbox_backend"] = self._backend
+            return payload
+
+_SANDBOX_POOLS: dict[tuple, _SandboxPool] = {}
+_SANDBOX_POOLS_LOCK = threading.Lock()
+
+
+def _get_sandbox_pool(cfg: SafeFetchPolicy, backend: str) -> _SandboxPool | None:
+    if backend not in {"firejail", "docker"}:
+        return None
+    # Key on the policy fields that shape the command so the (dozens of
+    # flags long) command list is only built once per distinct policy.
+    key = (
+        backend,
+        cfg.timeout_s,
+        cfg.max_redirects,
+        cfg.max_bytes,
+        cfg.user_agent,
+        cfg.allow_private_network,
+        cfg.firejail_bin,
+        cfg.docker_bin,
+        cfg.docker_image,
+        cfg.docker_workdir,
+    )
+    with _SANDBOX_POOLS_LOCK:
+        pool = _SANDBOX_POOLS.get(key)
+        if pool is None:
+            pool = _SandboxPool(backend, _sandbox_command(cfg, backend))
+            _SANDBOX_POOLS[key] = pool
+    return pool
+
+
+def _invoke_sandbox_worker(url: str, cfg: SafeFetchPolicy) -> dict[str, Any]:
+    backend = cfg.sandbox_backend.strip().lower()
+    pool = _get_sandbox_pool(cfg, backend)
+    if pool is None:
+        return {"url": url, "status": "blocked", "blocked_reason": "invalid_sandbox_backend"}
+    return pool.fetch(url, cfg.sandbox_exec_timeout_s)
 
 
 def safe_fetch_url(url: str, policy: SafeFetchPolicy | None = None) -> dict[str, Any]:
@@ -435,3 +689,17 @@ def analyze_url_target(url: str, policy: SafeFetchPolicy | None = None) -> dict[
         risk += 6
     result["risk_score"] = min(100, risk)
     return result
+
+
+def analyze_url_targets(urls: list[str], policy: SafeFetchPolicy | None = None) -> list[dict[str, Any]]:
+    """Analyze several URLs, overlapping their network waits on a thread pool.
+
+    Results keep input order. The per-origin connection pool, the DNS cache,
+    and the persistent sandbox workers are shared across the batch, so
+    independent hosts fetch concurrently while per-host state is reused.
+    """
+    if len(urls) > 1:
+        analyze_one = functools.partial(analyze_url_target, policy=policy)
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+            return list(pool.map(analyze_one, urls))
+    return [analyze_url_target(url, policy=policy) for url in urls]
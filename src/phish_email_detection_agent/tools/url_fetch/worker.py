@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 
 from phish_email_detection_agent.tools.url_fetch.service import SafeFetchPolicy, _safe_fetch_url_internal
 
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="argis-sandbox-fetch-worker")
-    parser.add_argument("--url", required=True)
+    parser.add_argument("--url", default="")
+    parser.add_argument("--serve", action="store_true", help="read URLs from stdin, one JSON line per URL")
     parser.add_argument("--timeout", type=float, default=8.0)
     parser.add_argument("--max-redirects", type=int, default=3)
     parser.add_argument("--max-bytes", type=int, default=1_000_000)
@@ -19,6 +21,28 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _serve(policy: SafeFetchPolicy) -> None:
+    """Fetch one URL per stdin line, emitting one JSON line per URL.
+
+    Lets the caller keep a single sandboxed process alive instead of paying
+    container startup per URL.
+    """
+    for line in sys.stdin:
+        url = line.strip()
+        if not url:
+            continue
+        try:
+            payload = _safe_fetch_url_internal(url, policy)
+        except Exception as exc:  # keep the loop alive for the next URL
+            payload = {
+                "url": url,
+                "status": "sandbox_error",
+                "blocked_reason": f"worker_exception:{type(exc).__name__}",
+            }
+        sys.stdout.write(json.dumps(payload, ensure_ascii=True) + "\n")
+        sys.stdout.flush()
+
+
 def main() -> None:
     args = _build_parser().parse_args()
     policy = SafeFetchPolicy(
@@ -31,6 +55,11 @@ def main() -> None:
         user_agent=args.user_agent,
         sandbox_backend="internal",
     )
+    if args.serve:
+        _serve(policy)
+        return
+    if not args.url:
+        raise SystemExit("--url is required unless --serve is set")
     payload = _safe_fetch_url_internal(args.url.strip(), policy)
     print(json.dumps(payload, ensure_ascii=True))
 
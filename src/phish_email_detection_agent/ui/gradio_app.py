@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from urllib.error import URLError
 from urllib.parse import urljoin
 from urllib.request import urlopen
 from typing import Any
 
+try:  # Optional accelerated JSON encoder.
+    import orjson
+except ImportError:  # pragma: no cover - fallback when perf extra is absent
+    orjson = None  # type: ignore[assignment]
+
 import gradio as gr
 
 from phish_email_detection_agent.orchestrator.build import create_agent
@@ -186,14 +192,39 @@ def _is_local_provider(provider: Any) -> bool:
     return str(provider or "").strip().lower() in {"local", "ollama"}
 
 
+def _dump_value(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=True)
+
+
+def _load_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def _format_stage_line(event: dict[str, Any]) -> str:
     stage = str(event.get("stage", "runtime")).upper()
     status = str(event.get("status", "info")).upper()
     message = str(event.get("message", ""))
     data = event.get("data")
     if isinstance(data, dict) and data:
-        compact = ", ".join(f"{k}={json.dumps(v, ensure_ascii=True)}" for k, v in data.items())
-        return f"[{stage}/{status}] {message} ({compact})"
+        # This runs once per streamed event; numbers and bools skip the JSON
+        # encoder entirely (their renderings below match json.dumps output).
+        parts = []
+        for key, value in data.items():
+            if value is True:
+                parts.append(f"{key}=true")
+            elif value is False:
+                parts.append(f"{key}=false")
+            elif value is None:
+                parts.append(f"{key}=null")
+            elif isinstance(value, (int, float)):
+                parts.append(f"{key}={value!r}")
+            else:
+                parts.append(f"{key}={_dump_value(value)}")
+        return f"[{stage}/{status}] {message} ({', '.join(parts)})"
     return f"[{stage}/{status}] {message}"
 
 
@@ -268,23 +299,51 @@ def _provider_mode_from_profile(profile: str) -> str:
     return "api"
 
 
-def _check_ollama_status(api_base: str | None) -> str:
+# Parsed /api/tags payloads per api_base with a short TTL. The status line,
+# the pre-run model check, and the dropdown refresh all probe the same
+# endpoint — often twice within one UI callback — and each urlopen pays a
+# fresh handshake.
+_TAGS_CACHE: dict[str, tuple[float, Any, str | None]] = {}
+_TAGS_CACHE_TTL_S = 5.0
+
+
+def _get_ollama_tags(api_base: str | None, timeout: float = 2.0) -> tuple[Any, str | None]:
+    """Return the parsed ``/api/tags`` payload and an error string, cached briefly."""
     base = str(api_base or "").strip()
     if not base:
-        return "Backend Status: Ollama profile selected but `api_base` is empty."
+        return None, "api_base is empty"
+    now = time.monotonic()
+    cached = _TAGS_CACHE.get(base)
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
 
     endpoint = urljoin(base if base.endswith("/") else f"{base}/", "api/tags")
+    payload: Any = None
+    error: str | None = None
     try:
-        with urlopen(endpoint, timeout=1.5) as resp:
+        with urlopen(endpoint, timeout=timeout) as resp:
             if getattr(resp, "status", 0) != 200:
-                return f"Backend Status: Ollama unreachable (HTTP {getattr(resp, 'status', 'unknown')})."
-            payload = json.loads(resp.read().decode("utf-8"))
-            models = payload.get("models", []) if isinstance(payload, dict) else []
-            return f"Backend Status: Ollama reachable at {base} (models discovered: {len(models)})."
+                error = f"HTTP {getattr(resp, 'status', 'unknown')}"
+            else:
+                payload = _load_json(resp.read())
     except URLError as exc:
-        return f"Backend Status: Ollama unreachable at {base} ({type(exc.reason).__name__})."
+        error = type(exc.reason).__name__
     except Exception as exc:  # pragma: no cover
-        return f"Backend Status: Ollama check failed at {base} ({type(exc).__name__})."
+        error = type(exc).__name__
+    _TAGS_CACHE[base] = (now + _TAGS_CACHE_TTL_S, payload, error)
+    return payload, error
+
+
+def _check_ollama_status(api_base: str | None) -> str:
+    base = str(api_base or "").strip()
+    if not base:
+        return "Backend Status: Ollama profile selected but `api_base` is empty."
+
+    payload, error = _get_ollama_tags(api_base, timeout=1.5)
+    if error:
+        return f"Backend Status: Ollama unreachable at {base} ({error})."
+    models = payload.get("models", []) if isinstance(payload, dict) else []
+    return f"Backend Status: Ollama reachable at {base} (models discovered: {len(models)})."
 
 
 def _normalize_ollama_model_name(model: str) -> str:
@@ -295,20 +354,9 @@ def _normalize_ollama_model_name(model: str) -> str:
 
 
 def _fetch_ollama_model_names(api_base: str | None) -> tuple[set[str], str | None]:
-    base = str(api_base or "").strip()
-    if not base:
-        return set(), "api_base is empty"
-
-    endpoint = urljoin(base if base.endswith("/") else f"{base}/", "api/tags")
-    try:
-        with urlopen(endpoint, timeout=2.0) as resp:
-            if getattr(resp, "status", 0) != 200:
-                return set(), f"HTTP {getattr(resp, 'status', 'unknown')}"
-            payload = json.loads(resp.read().decode("utf-8"))
-    except URLError as exc:
-        return set(), f"{type(exc.reason).__name__}"
-    except Exception as exc:  # pragma: no cover
-        return set(), type(exc).__name__
+    payload, error = _get_ollama_tags(api_base)
+    if error:
+        return set(), error
 
     models = payload.get("models", []) if isinstance(payload, dict) else []
     names: set[str] = set()
@@ -400,14 +448,14 @@ def _stream_with_selected_model(text: str, provider_mode: str, model: str):
     selected = (model or "").strip() or None
     agent, runtime = create_agent(profile_override=selected_profile, model_override=selected)
 
-    process_lines = [
-        (
-            f"profile={runtime['profile']} provider={runtime['provider']} "
-            f"model={runtime['model']} max_turns={runtime['max_turns']}"
-        ),
-    ]
+    # One running string instead of rejoining a growing line list per event;
+    # each yield costs a single concatenation regardless of stream length.
+    process_text = (
+        f"profile={runtime['profile']} provider={runtime['provider']} "
+        f"model={runtime['model']} max_turns={runtime['max_turns']}"
+    )
     result_text = ""
-    yield "\n".join(process_lines), result_text
+    yield process_text, result_text
 
     if _is_local_provider(runtime.get("provider", "")):
         available, error = _fetch_ollama_model_names(runtime.get("api_base"))
@@ -415,22 +463,22 @@ def _stream_with_selected_model(text: str, provider_mode: str, model: str):
         normalized = _normalize_ollama_model_name(requested)
         candidates = {requested, normalized, f"{normalized}:latest"}
         if error:
-            process_lines.append("[BLOCKED] Pre-run model check failed.")
+            process_text = f"{process_text}\n[BLOCKED] Pre-run model check failed."
             result_text = (
                 "Run blocked: unable to validate local Ollama models. "
                 f"Reason: {error}. Check Ollama service and api_base."
             )
-            yield "\n".join(process_lines), result_text
+            yield process_text, result_text
             return
         if not (candidates & available):
             installed = ", ".join(sorted(available)[:10]) if available else "(none)"
-            process_lines.append("[BLOCKED] Selected model is not installed in local Ollama.")
+            process_text = f"{process_text}\n[BLOCKED] Selected model is not installed in local Ollama."
             result_text = (
                 "Run blocked: selected model is not available in local Ollama.\n"
                 f"Selected: {requested}\n"
                 f"Installed: {installed}"
             )
-            yield "\n".join(process_lines), result_text
+            yield process_text, result_text
             return
 
     for event in agent.analyze_stream(text):
@@ -438,12 +486,12 @@ def _stream_with_selected_model(text: str, provider_mode: str, model: str):
             final = event.get("result")
             if isinstance(final, dict):
                 result_text = _format_compact_result(final, runtime)
-                process_lines.append("[DONE] Detection pipeline finished.")
-                yield "\n".join(process_lines), result_text
+                process_text = f"{process_text}\n[DONE] Detection pipeline finished."
+                yield process_text, result_text
             continue
 
-        process_lines.append(_format_stage_line(event))
-        yield "\n".join(process_lines), result_text
+        process_text = f"{process_text}\n{_format_stage_line(event)}"
+        yield process_text, result_text
 
 
 def build() -> gr.Blocks:
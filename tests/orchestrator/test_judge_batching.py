@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from phish_email_detection_agent.orchestrator.stages.judge import JudgeRunResult
+from phish_email_detection_agent.orchestrator.stages.judge_batch import BatchingJudgeExecutor
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def evaluate(self, **kwargs):
+        with self.lock:
+            self.calls.append(kwargs)
+        return JudgeRunResult(final_result={"tag": kwargs["tag"]}, judge_output=None)
+
+
+def test_batching_executor_returns_per_request_results():
+    engine = _FakeEngine()
+    executor = BatchingJudgeExecutor(engine, max_batch=4, max_wait_s=0.005)
+    try:
+        futures = [executor.submit(tag=i) for i in range(6)]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        executor.close()
+
+    assert [item.final_result["tag"] for item in results] == list(range(6))
+    assert len(engine.calls) == 6
+
+
+def test_batching_executor_evaluate_blocks_for_result():
+    engine = _FakeEngine()
+    executor = BatchingJudgeExecutor(engine, max_batch=2, max_wait_s=0.0)
+    try:
+        result = executor.evaluate(tag="solo")
+    finally:
+        executor.close()
+
+    assert result.final_result == {"tag": "solo"}
+
+
+def test_batching_executor_rejects_submit_after_close():
+    executor = BatchingJudgeExecutor(_FakeEngine())
+    executor.close()
+    with pytest.raises(RuntimeError):
+        executor.submit(tag="late")
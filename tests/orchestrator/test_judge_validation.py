@@ -3,7 +3,7 @@ import types
 import json
 from types import SimpleNamespace
 
-from phish_email_detection_agent.domain.evidence import EvidencePack
+from phish_email_detection_agent.domain.evidence import EvidencePack, TriageResult
 from phish_email_detection_agent.orchestrator.pipeline_policy import PipelinePolicy
 from phish_email_detection_agent.orchestrator.stages.judge import JudgeEngine
 
@@ -93,6 +93,11 @@ def test_judge_engine_evaluate_attaches_validation_issues(monkeypatch):
     assert payload["judge_context"]["pre_score"]["evidence_id"].startswith("evd_")
     stored_judge = result.final_result["evidence"]["judge"]
     assert stored_judge["top_evidence"][0]["evidence_id"].startswith("evd_")
+    # The final dict is built directly; keep its shape pinned to the contract.
+    assert set(result.final_result) == set(TriageResult.model_fields) | {
+        "precheck",
+        "validation_issues",
+    }
 
 
 def test_judge_engine_validator_reports_missing_indicators():